@@ -0,0 +1,36 @@
+# src/etl/extract/arrow_utils.py
+from typing import Optional
+
+import pandas as pd
+import pyarrow as pa
+
+# jemalloc fragments less than the system allocator on multi-GB tables.
+# Not every pyarrow build ships it (e.g. some Windows/macOS wheels).
+try:
+    pa.set_memory_pool(pa.jemalloc_memory_pool())
+except (ImportError, NotImplementedError):
+    pass
+
+
+def arrow_types_mapper(arrow_type: pa.DataType) -> Optional[pd.api.extensions.ExtensionDtype]:
+    """
+    types_mapper for Table.to_pandas: keep columns Arrow-backed (pd.ArrowDtype),
+    except timestamps, which stay numpy datetime64 so normalization builds a real
+    DatetimeIndex (tz_localize / tz_convert / resample).
+    """
+    if pa.types.is_timestamp(arrow_type):
+        return None
+    return pd.ArrowDtype(arrow_type)
+
+
+def table_to_pandas(table: pa.Table) -> pd.DataFrame:
+    """
+    Convert an Arrow table handing its buffers over to pandas.
+    The table must not be used afterwards (self_destruct frees columns as they convert).
+    """
+    return table.to_pandas(
+        zero_copy_only=False,
+        self_destruct=True,
+        split_blocks=True,
+        types_mapper=arrow_types_mapper,
+    )
@@ -1,5 +1,9 @@
+import os
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
 
 from ..utils.logger import get_logger
 from .csv_reader import CSVReader
@@ -9,11 +13,21 @@ from .parquet_reader import ParquetReader
 logger = get_logger("Extractor")
 
 
+def _read_worker(path: Path, file_type: str) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    # one reader per call: readers keep per-read metadata state
+    reader = CSVReader() if file_type == "csv" else ParquetReader()
+    df = reader.read(path)
+    return df, reader.metadata() or {}
+
+
 class Extractor:
-    def __init__(self, raw_path: Path):
+    def __init__(self, raw_path: Path, max_workers: Optional[int] = None):
         self.raw_path = raw_path
-        self.csv_reader = CSVReader()
-        self.parquet_reader = ParquetReader()
+        self.max_workers = max_workers
+
+    def _workers(self, n_files: int) -> int:
+        limit = self.max_workers or os.cpu_count() or 1
+        return max(1, min(n_files, limit))
 
     def load_all(self) -> List[Dict]:
         """
@@ -23,39 +37,52 @@ class Extractor:
                 "meta": metadata from reader (if available),
                 "filename": str
             }
+
+        Files are read in a thread pool: both readers parse with pyarrow, which
+        releases the GIL and shares one Arrow CPU pool across threads. Results
+        keep the directory listing order.
         """
-        results = []
-
-        for file in self.raw_path.iterdir():
-            if not file.is_file():
-                continue
-
-            try:
-                file_type = detect_file_type(file)
-
-                if file_type == "csv":
-                    df = self.csv_reader.read(file)
-                    meta = {}
-                    if hasattr(self.csv_reader, "metadata"):
-                        try:
-                            meta = self.csv_reader.metadata() or {}
-                        except Exception:
-                            meta = {}
-
-                else:
-                    df = self.parquet_reader.read(file)
-                    meta = {}
-                    if hasattr(self.parquet_reader, "metadata"):
-                        try:
-                            meta = self.parquet_reader.metadata() or {}
-                        except Exception:
-                            meta = {}
-
-                results.append({"df": df, "meta": meta, "filename": file.name})
-
-            except Exception:
-                logger.error(f"File moved to quarantine: {file}")
-                # aquí mover a carpeta quarantine si quieres
-                continue
-
-        return results
+        # file -> type, in directory listing order
+        file_types: Dict[Path, str] = {}
+        sizes: Dict[Path, int] = {}
+
+        # scandir: is_file() comes from the directory read itself, no extra stat per entry
+        with os.scandir(self.raw_path) as it:
+            for entry in it:
+                if not entry.is_file():
+                    continue
+                file = Path(entry.path)
+                try:
+                    file_type = detect_file_type(entry.name)
+                except Exception:
+                    logger.error("File moved to quarantine: %s", file)
+                    # aquí mover a carpeta quarantine si quieres
+                    continue
+                file_types[file] = file_type
+                sizes[file] = entry.stat().st_size
+
+        # submit the largest files first so long reads don't end up last in the pool
+        files = sorted(file_types, key=sizes.__getitem__, reverse=True)
+
+        loaded: Dict[Path, Dict] = {}
+
+        if files:
+            with ThreadPoolExecutor(max_workers=self._workers(len(files))) as pool:
+                futures = {pool.submit(_read_worker, f, file_types[f]): f for f in files}
+                for fut in as_completed(futures):
+                    file = futures[fut]
+                    result = self._collect(fut, file)
+                    if result is not None:
+                        df, meta = result
+                        loaded[file] = {"df": df, "meta": meta, "filename": file.name}
+
+        return [loaded[f] for f in file_types if f in loaded]
+
+    @staticmethod
+    def _collect(fut: Future, file: Path) -> Optional[Any]:
+        try:
+            return fut.result()
+        except Exception:
+            logger.error("File moved to quarantine: %s", file)
+            # aquí mover a carpeta quarantine si quieres
+            return None
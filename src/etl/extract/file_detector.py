@@ -1,11 +1,15 @@
 # src/etl/extract/file_detector.py
+import os
 from pathlib import Path
+from typing import Union
 
+_EXT_MAP = {".csv": "csv", ".parquet": "parquet"}
 
-def detect_file_type(path: Path) -> str:
-    ext = path.suffix.lower()
-    if ext == ".csv":
-        return "csv"
-    if ext == ".parquet":
-        return "parquet"
-    raise ValueError(f"Unsupported file type: {ext}")
+
+def detect_file_type(path: Union[str, Path]) -> str:
+    # splitext works on plain strings too (e.g. os.DirEntry.name), no PurePath needed
+    ext = os.path.splitext(path)[1].lower()
+    file_type = _EXT_MAP.get(ext)
+    if file_type is None:
+        raise ValueError(f"Unsupported file type: {ext}")
+    return file_type
@@ -1,10 +1,14 @@
 # src/etl/extract/parquet_reader.py
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 from ..utils.logger import get_logger
+from ..utils.shrink import shrink_numeric
+from .arrow_utils import table_to_pandas
 from .base_reader import BaseReader
 
 logger = get_logger("ParquetReader")
@@ -13,27 +17,58 @@ logger = get_logger("ParquetReader")
 class ParquetReader(BaseReader):
     _metadata: Dict[str, Any]
 
-    def __init__(self) -> None:
+    def __init__(self, columns: Optional[List[str]] = None) -> None:
+        """
+        columns: optional projection; only these columns are decoded from the file.
+        """
         self._metadata = {}
+        self._columns = columns
 
     def read(self, path: Path) -> pd.DataFrame:
         try:
-            df = pd.read_parquet(path, engine="pyarrow")
+            allocated_before = pa.total_allocated_bytes()
+            # memory-mapped source: column chunks are read through the page cache
+            # instead of being copied into heap buffers first. Arrow buffers keep
+            # the mapped region alive, so closing the handle here is safe.
+            with pa.memory_map(str(path), "r") as source:
+                pf = pq.ParquetFile(source)
+                file_meta = pf.metadata
+                schema = pf.schema_arrow
+
+                # project only requested columns that actually exist in the file
+                cols: Optional[List[str]] = None
+                if self._columns is not None:
+                    available = set(schema.names)
+                    cols = [c for c in self._columns if c in available]
+
+                # Arrow's own thread pool decodes columns / row groups in parallel;
+                # Extractor already reads files concurrently, so no extra pool here
+                table = pf.read(columns=cols, use_threads=True)
+
+            df = table_to_pandas(table)
+            del table
+            shrink_numeric(df)
 
             self._metadata = {
-                "rows": len(df),
+                "rows": file_meta.num_rows,
                 "columns": df.columns.tolist(),
                 "path": str(path),
                 "status": "success",
                 "type": "parquet",
+                "schema": {f.name: str(f.type) for f in schema},
+                "row_groups": file_meta.num_row_groups,
+                "arrow_allocated_bytes": {
+                    "before": allocated_before,
+                    "after": pa.total_allocated_bytes(),
+                },
             }
 
-            logger.info(f"Loaded Parquet: {path} ({len(df)} rows)")
+            logger.info("Loaded Parquet: %s (%d rows)", path, len(df))
             return df
 
         except Exception as e:
             self._metadata = {"path": str(path), "status": "error", "error": str(e)}
-            logger.error(f"Failed to load Parquet {path}: {e}")
+            logger.error("Failed to load Parquet %s: %s", path, e)
             raise
 
     def metadata(self) -> Dict[str, Any]:
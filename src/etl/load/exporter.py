@@ -1,16 +1,24 @@
 from __future__ import annotations
 
-import hashlib
-import json
+import os
 from pathlib import Path
-from typing import Dict, List, Optional
+from types import TracebackType
+from typing import Dict, List, Optional, Type
 
+import numpy as np
+import orjson
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import xxhash
 
 from ..utils.logger import get_logger
 
 logger = get_logger("Exporter")
 
+# numpy scalars/arrays from report aggregations + non-str dict keys
+_ORJSON_OPTS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
 
 def _ensure_dir(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
@@ -31,8 +39,8 @@ def validate_final_df(df: pd.DataFrame) -> Dict:
     if tz is None:
         raise ValueError("Index timezone is not set (expected UTC).")
 
-    # no duplicated timestamps
-    dups = int(df.index.duplicated().sum())
+    # no duplicated timestamps (hash count only; no boolean mask is materialized)
+    dups = int(len(df.index) - df.index.nunique(dropna=False))
     report["duplicated_timestamps"] = dups
     if dups > 0:
         # non-fatal but reported
@@ -40,18 +48,17 @@ def validate_final_df(df: pd.DataFrame) -> Dict:
 
     # OHLC sanity checks if present
     if {"OPEN", "HIGH", "LOW", "CLOSE"}.issubset(df.columns):
-        negative_price = False
-        if (df[["OPEN", "HIGH", "LOW", "CLOSE"]] < 0).any().any():
-            report["negative_prices"] = True
-            negative_price = True
-        else:
-            report["negative_prices"] = False
-
-        # LOW <= min(OPEN,HIGH,CLOSE) & HIGH >= max(...)
-        invalid_low = (df["LOW"] > df[["OPEN", "HIGH", "CLOSE"]].min(axis=1)).any()
-        invalid_high = (df["HIGH"] < df[["OPEN", "LOW", "CLOSE"]].max(axis=1)).any()
-        report["invalid_low"] = bool(invalid_low)
-        report["invalid_high"] = bool(invalid_high)
+        # one contiguous float64 block; NA -> NaN so Arrow-backed columns convert too
+        arr = df[["OPEN", "HIGH", "LOW", "CLOSE"]].to_numpy(dtype=np.float64, na_value=np.nan)
+        o, h, lo, c = arr.T
+        negative_price = bool((arr < 0).any())
+        report["negative_prices"] = negative_price
+
+        # LOW <= min(OPEN,HIGH,CLOSE) & HIGH >= max(...); fmin/fmax skip NaN like pandas
+        invalid_low = bool((lo > np.fmin(np.fmin(o, h), c)).any())
+        invalid_high = bool((h < np.fmax(np.fmax(o, lo), c)).any())
+        report["invalid_low"] = invalid_low
+        report["invalid_high"] = invalid_high
 
         if negative_price or invalid_low or invalid_high:
             logger.warning(
@@ -62,7 +69,7 @@ def validate_final_df(df: pd.DataFrame) -> Dict:
             )
 
     # final row count / start / end
-    report["rows"] = int(len(df))
+    report["rows"] = len(df)
     if len(df) > 0:
         report["start"] = str(df.index.min())
         report["end"] = str(df.index.max())
@@ -76,21 +83,45 @@ def validate_final_df(df: pd.DataFrame) -> Dict:
 def _make_hash_of_df(df: pd.DataFrame, keys: Optional[List[str]] = None) -> str:
     """
     Lightweight content hash: use index min/max and row count and first/last rows of keys.
-    Avoid expensive full-data hashing.
+    Avoid expensive full-data hashing. xxh3 over raw bytes (no str() of values):
+    this identifies content, it is not a cryptographic digest.
     """
-    h = hashlib.sha256()
-    h.update(str(len(df)).encode())
+    h = xxhash.xxh3_128()
+    h.update(len(df).to_bytes(8, "little"))
     if len(df) > 0:
-        h.update(str(df.index.min()).encode())
-        h.update(str(df.index.max()).encode())
+        i8 = df.index.asi8
+        h.update(int(i8.min()).to_bytes(8, "little", signed=True))
+        h.update(int(i8.max()).to_bytes(8, "little", signed=True))
     if keys:
         for k in keys:
             if k in df.columns:
-                sample = df[k].dropna().head(3).to_list()
-                h.update(str(sample).encode())
+                sample = df[k].dropna().head(3).to_numpy(dtype=np.float64)
+                h.update(sample.tobytes())
     return h.hexdigest()
 
 
+def _export_casts(df: pd.DataFrame) -> Dict[str, object]:
+    """
+    Casts back to the canonical export dtypes: float64 / int64 (Arrow or numpy backed,
+    as given). shrink_numeric narrows columns per file (int8 vs int16 VOLUME, float32
+    prices when exact); written as-is, the parquet schema would depend on the data.
+    """
+    casts: Dict[str, object] = {}
+    for c, dtype in df.dtypes.items():
+        if isinstance(dtype, pd.ArrowDtype):
+            pa_type = dtype.pyarrow_dtype
+            if pa.types.is_integer(pa_type) and pa_type.bit_width < 64:
+                casts[c] = "int64[pyarrow]"
+            elif pa.types.is_floating(pa_type) and pa_type.bit_width < 64:
+                casts[c] = "double[pyarrow]"
+        elif isinstance(dtype, np.dtype) and dtype.itemsize < 8:
+            if dtype.kind in "iu":
+                casts[c] = np.int64
+            elif dtype.kind == "f":
+                casts[c] = np.float64
+    return casts
+
+
 def _prepare_partition_cols(
     df: pd.DataFrame, partition_cols: Optional[List[str]] = None
 ) -> List[str]:
@@ -125,6 +156,48 @@ def _prepare_partition_cols(
     return actual
 
 
+def _write_row_groups(
+    df: pd.DataFrame,
+    out_path: Path,
+    schema_metadata: Dict[bytes, bytes],
+    compression: str,
+    row_group_size: int,
+    compression_level: Optional[int] = None,
+) -> None:
+    """
+    Stream df to a single parquet file with ParquetWriter, converting one
+    row-group-sized slice at a time (index kept as a column, restored on read).
+    """
+    # schema inferred once from the whole frame: typing each slice on its own would
+    # give an all-None object column in the first row group the null type
+    schema = pa.Schema.from_pandas(df, preserve_index=True)
+    schema = schema.with_metadata({**(schema.metadata or {}), **schema_metadata})
+    writer: Optional[pq.ParquetWriter] = None
+    try:
+        # max(..., 1): an empty frame still produces a file with its schema
+        for start in range(0, max(len(df), 1), row_group_size):
+            chunk = pa.Table.from_pandas(
+                df.iloc[start : start + row_group_size],
+                schema=schema,
+                preserve_index=True,
+                nthreads=os.cpu_count(),
+            )
+            if writer is None:
+                writer = pq.ParquetWriter(
+                    out_path,
+                    schema,
+                    compression=compression,
+                    compression_level=compression_level,
+                    use_dictionary=True,
+                    write_statistics=True,
+                    data_page_size=1 << 20,
+                )
+            writer.write_table(chunk, row_group_size=row_group_size)
+    finally:
+        if writer is not None:
+            writer.close()
+
+
 def write_parquet_with_metadata(
     df: pd.DataFrame,
     out_path: Path,
@@ -133,66 +206,95 @@ def write_parquet_with_metadata(
     engine: str = "pyarrow",
     partition_cols: Optional[List[str]] = None,
     metadata: Optional[Dict] = None,
+    row_group_size: int = 1_000_000,
+    compression_level: Optional[int] = None,
 ) -> Dict:
     """
-    Validate, attach metadata to attrs, write parquet, and return an export report dict.
+    Validate, embed metadata (with df.attrs) and the export report in the parquet
+    footer, write parquet, and return the export report dict.
+
+    compression_level: codec level (e.g. zstd 1 for fast writes); None = codec default.
+
+    Non-partitioned output is streamed one row group (`row_group_size` rows) at a
+    time, so only one chunk is held as an Arrow table at once.
     """
     _ensure_dir(out_path.parent)
 
     # Validate
     val_report = validate_final_df(df)
 
-    # Prepare metadata to attach (attrs)
-    if metadata is None:
-        metadata = {}
+    # Prepare metadata to attach (local dict: the caller's metadata is not mutated)
+    metadata = dict(metadata or {})
     # minimal metadata
     metadata.setdefault("exporter_version", "v1")
-    metadata.setdefault("rows", int(len(df)))
+    metadata.setdefault("rows", len(df))
     # keep normalization_report if present in attrs
     if "normalization_report" in getattr(df, "attrs", {}):
         metadata["normalization_report"] = df.attrs["normalization_report"]
 
-    # attach attrs
-    df = df.copy()
-    df.attrs.update(metadata)
-
-    # prepare partition columns (possibly creating YEAR / MONTH)
+    # attrs to embed: the caller's DataFrame is left untouched (no copy, no attrs update)
+    attrs = {**df.attrs, **metadata}
+
+    # prepare partition columns (possibly creating YEAR / MONTH) and dtype casts on a
+    # shallow view so the caller's frame is not modified; only cast columns are copied
+    casts = _export_casts(df)
+    unnamed_index = df.index.name is None
+    work = df.copy(deep=False) if partition_cols or casts or unnamed_index else df
+    for c, dtype in casts.items():
+        work[c] = work[c].astype(dtype)
+    if unnamed_index:
+        # same physical column name as the old reset_index() export ("index"), not
+        # pyarrow's __index_level_0__, for non-pandas readers (pyarrow, duckdb, spark)
+        work.index = work.index.rename("index")
     # mypy: mapped_partitions can be a list or None
-    mapped_partitions: Optional[List[str]] = _prepare_partition_cols(df, partition_cols)
+    mapped_partitions: Optional[List[str]] = _prepare_partition_cols(work, partition_cols)
     if mapped_partitions == []:
         mapped_partitions = None
 
-    to_write = df.reset_index()
-
-    # ensure partition columns exist in reset dataframe
-    if mapped_partitions:
-        mapped_partitions = [c for c in mapped_partitions if c in to_write.columns]
-        if not mapped_partitions:
-            mapped_partitions = None
+    # codecs without levels (snappy, none) reject compression_level: drop it for those
+    if compression_level is not None:
+        try:
+            supports_level = pa.Codec.supports_compression_level(compression)
+        except ValueError:
+            supports_level = False
+        if not supports_level:
+            compression_level = None
 
-    # convert metadata summary to JSON serializable subset and store as metadata file alongside parquet
+    # export summary; embedded in the parquet footer below (EXPORT_REPORT key)
     export_report: Dict = {
         "path": str(out_path),
         "compression": compression,
+        "compression_level": compression_level,
         "engine": engine,
         "partition_cols": mapped_partitions,
-        "rows": int(len(df)),
+        "rows": len(df),
     }
     export_report.update(val_report)
 
-    # write parquet
-    to_write.to_parquet(
-        out_path,
-        engine=engine,
-        compression=compression,
-        index=False,
-        partition_cols=mapped_partitions,
-    )
+    # file-level KV metadata: PANDAS_ATTRS is the key pandas reads back into df.attrs;
+    # EXPORT_REPORT replaces the old .meta.json sidecar (one file, one footer read)
+    attrs_meta = {
+        b"PANDAS_ATTRS": orjson.dumps(attrs, option=_ORJSON_OPTS),
+        b"EXPORT_REPORT": orjson.dumps(export_report, option=_ORJSON_OPTS),
+    }
 
-    # write sidecar metadata file (json)
-    meta_path = out_path.with_name(out_path.name + ".meta.json")
-    with open(meta_path, "w", encoding="utf-8") as fh:
-        json.dump(export_report, fh, indent=2, ensure_ascii=False)
+    # write parquet
+    if mapped_partitions:
+        # partitioning needs the whole table to split by key
+        table = pa.Table.from_pandas(work, preserve_index=True, nthreads=os.cpu_count())
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}), **attrs_meta})
+        pq.write_to_dataset(
+            table,
+            root_path=str(out_path),
+            partition_cols=mapped_partitions,
+            compression=compression,
+            compression_level=compression_level,
+        )
+        del table
+    else:
+        _write_row_groups(
+            work, out_path, attrs_meta, compression, row_group_size, compression_level
+        )
 
     # compute light hash
     export_report["content_hash"] = _make_hash_of_df(
@@ -210,11 +312,76 @@ def write_parquet_with_metadata(
     return export_report
 
 
+# O_APPEND: every write lands at the current end of file, so whole-line writes from
+# concurrent processes (one per input file) never interleave mid-line
+_LOG_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """os.write may write fewer bytes than given: keep going until all of data is out."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view) :]
+
+
 def append_export_log(log_dir: Path, entry: Dict) -> None:
     """
     Append a single JSON line to export_log.ndjson
     """
     _ensure_dir(log_dir)
-    log_file = log_dir / "export_log.ndjson"
-    with open(log_file, "a", encoding="utf-8") as fh:
-        fh.write(json.dumps(entry, ensure_ascii=False) + "\n")
+    line = orjson.dumps(entry, option=_ORJSON_OPTS | orjson.OPT_APPEND_NEWLINE)
+    fd = os.open(log_dir / "export_log.ndjson", _LOG_FLAGS, 0o644)
+    try:
+        _write_all(fd, line)
+    finally:
+        os.close(fd)
+
+
+class ExportLog:
+    """
+    Context-managed appender for export_log.ndjson.
+
+    Keeps a single O_APPEND descriptor open for a batch of exports instead of an
+    open/write/close per entry. Entries are serialized with orjson and written
+    as whole lines, flush_every entries per write.
+
+        with ExportLog(log_dir) as log:
+            log.append(entry)
+    """
+
+    def __init__(self, log_dir: Path, flush_every: int = 64) -> None:
+        self.log_dir = log_dir
+        self.log_file = log_dir / "export_log.ndjson"
+        self.flush_every = flush_every
+        self._fd: Optional[int] = None
+        self._pending: List[bytes] = []
+
+    def __enter__(self) -> "ExportLog":
+        _ensure_dir(self.log_dir)
+        self._fd = os.open(self.log_file, _LOG_FLAGS, 0o644)
+        return self
+
+    def append(self, entry: Dict) -> None:
+        if self._fd is None:
+            raise RuntimeError("ExportLog must be used as a context manager.")
+        self._pending.append(orjson.dumps(entry, option=_ORJSON_OPTS | orjson.OPT_APPEND_NEWLINE))
+        if len(self._pending) >= self.flush_every:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._fd is not None and self._pending:
+            _write_all(self._fd, b"".join(self._pending))
+            self._pending.clear()
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        if self._fd is not None:
+            try:
+                self.flush()
+            finally:
+                os.close(self._fd)
+                self._fd = None
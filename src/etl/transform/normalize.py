@@ -1,75 +1,104 @@
 # src/etl/transform/normalize.py
 from __future__ import annotations
 
-import logging
+from functools import lru_cache
 from typing import Dict, List, Tuple
 from zoneinfo import ZoneInfo
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 
+from ..utils.columns import PROTECTED
 from ..utils.logger import get_logger
 
-logger = logging.getLogger(__name__)
 logger = get_logger("Normalize")
 
-PROTECTED = {"symbol", "ticker", "instrument", "pair"}
+PRICE_COLS = ("OPEN", "HIGH", "LOW", "CLOSE")
 
+# valor int64 con el que pandas representa NaT en DatetimeIndex.asi8
+_NAT_I8 = np.iinfo(np.int64).min
 
-def _build_rename_map(df_cols: List[str], columns_map: Dict[str, List[str]]) -> Dict[str, str]:
-    """
-    Construye el diccionario de columnas a renombrar,
-    evitando match por substring y excluyendo columnas protegidas.
-    """
-    rename_dict: Dict[str, str] = {}
-    lowered = {c: c.lower() for c in df_cols}
 
-    for target, variants in columns_map.items():
-        target_up = target.upper()
-        variants_lower = [v.lower() for v in variants]
+@lru_cache(maxsize=64)
+def _zi(key: str) -> ZoneInfo:
+    """ZoneInfo cacheado por nombre: se reutiliza el mismo objeto tz en cada fichero."""
+    return ZoneInfo(key)
 
-        for col, col_lower in lowered.items():
 
-            # ❌ No renombrar columnas protegidas (symbol, ticker...)
-            if col_lower in PROTECTED:
-                continue
+def _nan_to_null(s: pd.Series) -> pd.Series:
+    """
+    pd.to_numeric sobre una columna Arrow (p. ej. string del lector CSV) deja los
+    tokens no numéricos como NaN de coma flotante, no como nulo: isna() no los ve.
+    Los convierte en nulos para que cuenten como coerción y como dato ausente.
+    """
+    if not isinstance(s.dtype, pd.ArrowDtype) or not pa.types.is_floating(s.dtype.pyarrow_dtype):
+        return s
+    arr = pa.array(s.array)
+    arr = pc.if_else(pc.is_nan(arr), pa.scalar(None, arr.type), arr)
+    return pd.Series(pd.arrays.ArrowExtensionArray(arr), index=s.index, name=s.name)
 
-            # ✔ Coincidencia exacta (open == open, OPEN == open)
-            if col_lower in variants_lower:
-                rename_dict[col] = target_up
-                continue
 
-            # ✔ Coincidencia controlada por prefijo o sufijo
-            for v in variants_lower:
-                if not v:
-                    continue
+def _build_rename_map(df_cols: List[str], columns_map: Dict[str, List[str]]) -> Dict[str, str]:
+    """
+    Construye el diccionario de columnas a renombrar,
+    evitando match por substring y excluyendo columnas protegidas.
 
-                # prefijo exacto: open_price → OPEN
-                if col_lower.startswith(v + "_"):
-                    rename_dict[col] = target_up
-                    break
+    Las variantes se indexan una sola vez en un dict {variante_lower: orden_target};
+    cada columna se resuelve con búsquedas O(1). Si varios targets coinciden gana el
+    último de columns_map (mismo comportamiento que el recorrido anidado original).
+    """
+    targets = [t.upper() for t in columns_map]
+    alias: Dict[str, int] = {}
+    for order, variants in enumerate(columns_map.values()):
+        for v in variants:
+            alias[v.lower()] = order
 
-                # sufijo exacto: price_open → OPEN
-                if col_lower.endswith("_" + v):
-                    rename_dict[col] = target_up
-                    break
+    rename_dict: Dict[str, str] = {}
+    for col in df_cols:
+        col_lower = col.lower()
+
+        # ❌ No renombrar columnas protegidas (symbol, ticker...)
+        if col_lower in PROTECTED:
+            continue
+
+        # ✔ Coincidencia exacta (open == open, OPEN == open)
+        matches = [alias[col_lower]] if col_lower in alias else []
+
+        # ✔ Coincidencia controlada por prefijo o sufijo en cada "_":
+        #   open_price → OPEN (prefijo), price_open → OPEN (sufijo)
+        pos = col_lower.find("_")
+        while pos != -1:
+            prefix, suffix = col_lower[:pos], col_lower[pos + 1 :]
+            if prefix and prefix in alias:
+                matches.append(alias[prefix])
+            if suffix and suffix in alias:
+                matches.append(alias[suffix])
+            pos = col_lower.find("_", pos + 1)
+
+        if matches:
+            rename_dict[col] = targets[max(matches)]
 
     return rename_dict
 
 
 def normalize_columns(
-    df: pd.DataFrame, columns_map: Dict[str, List[str]]
+    df: pd.DataFrame, columns_map: Dict[str, List[str]], *, copy: bool = False
 ) -> Tuple[pd.DataFrame, Dict]:
     """
-    Rename columns based on a mapping dictionary. Returns (df_copy, report)
+    Rename columns based on a mapping dictionary. Returns (df, report)
     Report contains rename mapping and unmatched columns.
+    Works on df in place unless copy=True.
     """
-    df = df.copy()
+    if copy:
+        df = df.copy()
     report: Dict = {"renamed": {}, "unmatched": []}
 
     rename_dict = _build_rename_map(list(df.columns), columns_map)
     if rename_dict:
-        logger.info(f"Renaming columns: {rename_dict}")
-        df = df.rename(columns=rename_dict)
+        logger.info("Renaming columns: %s", rename_dict)
+        df.rename(columns=rename_dict, inplace=True)
         report["renamed"] = rename_dict
     # report columns that look like they could be numeric but not mapped (informativo)
     expected_targets = {t.upper() for t in columns_map.keys()}
@@ -78,12 +107,21 @@ def normalize_columns(
     return df, report
 
 
-def enforce_dtypes(df: pd.DataFrame, required_cols: List[str]) -> Tuple[pd.DataFrame, Dict]:
+def enforce_dtypes(
+    df: pd.DataFrame,
+    required_cols: List[str],
+    *,
+    copy: bool = False,
+    arrow_backend: bool = False,
+) -> Tuple[pd.DataFrame, Dict]:
     """
     Convert columns to proper dtypes (numeric coerced to NaN on failure).
-    Returns (df_copy, report_of_coercions)
+    Returns (df, report_of_coercions). Works on df in place unless copy=True.
+    With arrow_backend=True numeric columns end up Arrow-backed
+    (int64[pyarrow] for integers, float64[pyarrow] otherwise).
     """
-    df = df.copy()
+    if copy:
+        df = df.copy()
     report: Dict = {"missing_required": [], "numeric_coercions": {}}
 
     # required columns check (case-sensitive after rename; tests expect OPEN/HIGH/LOW/CLOSE)
@@ -94,19 +132,28 @@ def enforce_dtypes(df: pd.DataFrame, required_cols: List[str]) -> Tuple[pd.DataF
     if report["missing_required"]:
         raise ValueError(f"Missing required column(s): {report['missing_required']}")
 
-    numeric_cols = [
-        c
-        for c in ["OPEN", "HIGH", "LOW", "CLOSE", "VOLUME", "TICKVOL", "SPREAD"]
-        if c in df.columns
-    ]
-
-    # Numeric coercion
-    for c in numeric_cols:
-        df[c] = pd.to_numeric(df[c], errors="coerce")
-        n_coerced = df[c].isna().sum()
-        report["numeric_coercions"][c] = int(n_coerced)
+    numeric_cols = [c for c in [*PRICE_COLS, "VOLUME", "TICKVOL", "SPREAD"] if c in df.columns]
+
+    # Numeric coercion: the whole block at once, NaNs counted in a single reduction
+    if numeric_cols:
+        coerced = df[numeric_cols].apply(pd.to_numeric, errors="coerce").apply(_nan_to_null)
+        nan_counts = coerced.isna().sum()
+        if arrow_backend:
+            # precios siempre float; volúmenes/contadores enteros se quedan enteros
+            coerced = coerced.astype(
+                {
+                    c: (
+                        "int64[pyarrow]"
+                        if c not in PRICE_COLS and pd.api.types.is_integer_dtype(t)
+                        else "float64[pyarrow]"
+                    )
+                    for c, t in coerced.dtypes.items()
+                }
+            )
+        df[numeric_cols] = coerced
+        report["numeric_coercions"] = {c: int(n) for c, n in nan_counts.items()}
 
-        logger.info(f"Dtype coercion: column={c}, coerced_to_NaN={n_coerced}")
+        logger.info("Dtype coercion (coerced_to_NaN): %s", report["numeric_coercions"])
 
     return df, report
 
@@ -115,6 +162,8 @@ def normalize_datetime(
     df: pd.DataFrame,
     source_tz: str | None,
     target_tz: str = "UTC",
+    *,
+    copy: bool = False,
 ) -> Tuple[pd.DataFrame, Dict]:
     """
     Normaliza la columna datetime del dataframe a timezone-aware y convierte a target_tz.
@@ -129,9 +178,11 @@ def normalize_datetime(
     Devuelve (df_normalizado, report) donde report contiene keys:
       datetime_col, coerced_rows, tz_action, original_tz, final_tz,
       ambiguous_count, needs_review
+
+    Trabaja sobre df in place salvo que copy=True.
     """
-    # defensive copy
-    df = df.copy()
+    if copy:
+        df = df.copy()
     report: Dict = {
         "datetime_col": None,
         "coerced_rows": 0,
@@ -149,6 +200,17 @@ def normalize_datetime(
             datetime_col = col
             break
     if datetime_col is None:
+        # atajo: el índice ya es DatetimeIndex tz-aware en target_tz (p.ej. frame ya
+        # normalizado); no hay columna que lo reemplace, nada que convertir
+        idx = df.index
+        if isinstance(idx, pd.DatetimeIndex) and idx.tz is not None and str(idx.tz) == target_tz:
+            report.update(
+                datetime_col=idx.name,
+                tz_action="already_target",
+                original_tz=str(idx.tz),
+                final_tz=target_tz,
+            )
+            return df, report
         raise ValueError("No datetime column found in dataframe.")
     report["datetime_col"] = datetime_col
 
@@ -164,7 +226,7 @@ def normalize_datetime(
         )
 
     df[datetime_col] = coerced
-    df = df.set_index(datetime_col)
+    df.set_index(datetime_col, inplace=True)
 
     # 3) timezone handling
     orig_tz = getattr(df.index, "tz", None)
@@ -175,13 +237,13 @@ def normalize_datetime(
         if source_tz:
             # validar source_tz
             try:
-                ZoneInfo(source_tz)
+                source_zone = _zi(source_tz)
             except Exception as e:
                 logger.exception("Invalid source_tz '%s': %s", source_tz, e)
                 raise
             try:
                 df.index = df.index.tz_localize(
-                    source_tz, ambiguous="NaT", nonexistent="shift_forward"
+                    source_zone, ambiguous="NaT", nonexistent="shift_forward"
                 )
                 report["tz_action"] = f"localized_to_{source_tz}"
             except Exception as e:
@@ -192,7 +254,9 @@ def normalize_datetime(
             logger.warning(
                 "Timestamps tz-naive and no source_tz provided — assuming UTC and marking needs_review."
             )
-            df.index = df.index.tz_localize("UTC", ambiguous="NaT", nonexistent="shift_forward")
+            df.index = df.index.tz_localize(
+                _zi("UTC"), ambiguous="NaT", nonexistent="shift_forward"
+            )
             report["tz_action"] = "localized_to_UTC_assumed"
             report["needs_review"] = True
     else:
@@ -200,7 +264,8 @@ def normalize_datetime(
 
     # 4) contar ambiguous / NaT introducidos por la localización
     try:
-        ambiguous_count = int(df.index.isna().sum())
+        # int64 view: NaT is _NAT_I8, no Timestamp boxing on a tz-aware index
+        ambiguous_count = int(np.count_nonzero(df.index.asi8 == _NAT_I8))
         report["ambiguous_count"] = ambiguous_count
         if ambiguous_count > 0:
             logger.warning(
@@ -214,7 +279,7 @@ def normalize_datetime(
 
     # 5) convertir a target tz
     try:
-        df.index = df.index.tz_convert(target_tz)
+        df.index = df.index.tz_convert(_zi(target_tz))
         report["final_tz"] = target_tz
     except Exception as e:
         logger.exception("Failed to convert timezone to %s: %s", target_tz, e)
@@ -224,15 +289,20 @@ def normalize_datetime(
     return df, report
 
 
-def remove_duplicates(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict]:
-    """Remove duplicated timestamps. Returns (df_copy, report)."""
+def remove_duplicates(df: pd.DataFrame, *, copy: bool = False) -> Tuple[pd.DataFrame, Dict]:
+    """Remove duplicated timestamps. Returns (df, report)."""
+    if copy:
+        df = df.copy()
     before = len(df)
-    df = df[~df.index.duplicated(keep="first")].copy()
+    # dedup check on the int64 (ns) view: tz-aware indexes skip the per-element box path.
+    # The tz-aware index itself is kept; iloc already returns a new frame, no trailing copy.
+    keys = df.index.asi8 if isinstance(df.index, pd.DatetimeIndex) else df.index
+    df = df.iloc[~pd.Index(keys).duplicated(keep="first")]
     after = len(df)
     removed = before - after
     report = {"removed_duplicates": int(removed)}
     if removed > 0:
-        logger.info(f"Removed {removed} duplicated rows.")
+        logger.info("Removed %d duplicated rows.", removed)
     return df, report
 
 
@@ -242,11 +312,12 @@ def normalize_df(
     required_columns: List[str],
     source_tz: str | None,
     target_tz: str,
+    arrow_backend: bool = False,
 ) -> pd.DataFrame:
     """
     Complete normalization pipeline:
     - rename columns
-    - convert dtypes
+    - convert dtypes (Arrow-backed numerics if arrow_backend=True)
     - set & convert timezone
     - remove duplicates
 
@@ -255,14 +326,16 @@ def normalize_df(
     """
     logger.info("Starting normalization...")
 
-    # Work on a copy to avoid unexpected inplace modifications
-    df_work = df.copy()
+    # Single copy at entry; the helpers below then work on df_work in place (copy=False).
+    # Shallow is enough: they replace columns/index rather than writing into the
+    # caller's arrays, so the input frame is never modified.
+    df_work = df.copy(deep=False)
     full_report: Dict = {}
 
     df_work, col_report = normalize_columns(df_work, columns_map)
     full_report["columns"] = col_report
 
-    df_work, dtype_report = enforce_dtypes(df_work, required_columns)
+    df_work, dtype_report = enforce_dtypes(df_work, required_columns, arrow_backend=arrow_backend)
     full_report["dtypes"] = dtype_report
 
     df_work, dt_report = normalize_datetime(df_work, source_tz, target_tz)
@@ -271,8 +344,9 @@ def normalize_df(
     df_work, dup_report = remove_duplicates(df_work)
     full_report["duplicates"] = dup_report
 
-    # final checks & sort
-    df_work = df_work.sort_index()
+    # final checks & sort (broker exports usually arrive sorted: O(N) check, sort only if needed)
+    if not df_work.index.is_monotonic_increasing:
+        df_work.sort_index(inplace=True)
 
     # attach report to DataFrame attrs (no firma nueva)
     df_work.attrs["normalization_report"] = full_report
@@ -1,39 +1,219 @@
 # src/etl/transform/resample.py
 from __future__ import annotations
 
-from typing import Dict
+from datetime import timezone
+from typing import Callable, Dict, List, Optional, Set, Tuple
+from zoneinfo import ZoneInfo
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 
 from src.etl.utils.logger import get_logger
 
+# opcional: kernel JIT (pip install etl[fast]); sin numba se usa resample de pandas
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - depende del entorno
+    njit = None
+
 logger = get_logger("Resampler")
 
 
-def _build_agg_map(df: pd.DataFrame) -> Dict[str, str]:
+# Agregación OHLCV + columnas auxiliares (el orden define el de las columnas de salida)
+_OHLC_TEMPLATE: Dict[str, str] = {
+    "OPEN": "first",
+    "HIGH": "max",
+    "LOW": "min",
+    "CLOSE": "last",
+    # columnas de volumen -> sumar
+    "VOLUME": "sum",
+    "TICKVOL": "sum",
+    "VOL": "sum",
+    # conservar symbol (si existe) como last
+    "SYMBOL": "last",
+}
+
+
+def _build_agg_map(df: pd.DataFrame, cols: Optional[Set[str]] = None) -> Dict[str, str]:
     """
     Construye el mapa de agregación OHLCV y columnas auxiliares.
+    Devuelve un dict nuevo: el llamador puede extenderlo.
+    cols: set de columnas de df si el llamador ya lo tiene.
     """
-    agg: Dict[str, str] = {}
-    if "OPEN" in df.columns:
-        agg["OPEN"] = "first"
-    if "HIGH" in df.columns:
-        agg["HIGH"] = "max"
-    if "LOW" in df.columns:
-        agg["LOW"] = "min"
-    if "CLOSE" in df.columns:
-        agg["CLOSE"] = "last"
+    if cols is None:
+        cols = set(df.columns)
+    return {k: v for k, v in _OHLC_TEMPLATE.items() if k in cols}
 
-    # columnas de volumen -> sumar
-    for vol in ("VOLUME", "TICKVOL", "VOL"):
-        if vol in df.columns:
-            agg[vol] = "sum"
 
-    # conservar symbol (si existe) como last
-    if "SYMBOL" in df.columns:
-        agg["SYMBOL"] = "last"
+# códigos de agregación del kernel (mismo orden que las ramas de _ohlc_bins_loop)
+_KERNEL_OPS: Dict[str, int] = {"first": 0, "max": 1, "min": 2, "last": 3, "sum": 4, "mean": 5}
+# float32: solo agregaciones de selección (sum/mean de pandas acumulan en float32)
+_SELECT_OPS = frozenset(("first", "max", "min", "last"))
+_DAY_NS = 86_400 * 10**9
+_UTC_TZS = (timezone.utc, ZoneInfo("UTC"))
+
+
+def _ohlc_bins_loop(
+    ts: np.ndarray,
+    values: np.ndarray,
+    ops: np.ndarray,
+    start: int,
+    step: int,
+    n_bins: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Una pasada sobre el índice ordenado (int64 ns): la fila i cae en el bin
+    (ts[i] - start) // step. values: (n_cols, n_rows) float64, NaN = ausente.
+    Devuelve (out (n_cols, n_bins), size (n_bins,)) con la semántica de pandas:
+    first/max/min/last/mean ignoran NaN, sum sin valores = 0, sumas Kahan.
+    Escrito para numba; sin fastmath (las comprobaciones de NaN deben sobrevivir).
+    """
+    n_cols = values.shape[0]
+    out = np.full((n_cols, n_bins), np.nan)
+    comp = np.zeros((n_cols, n_bins))
+    nobs = np.zeros((n_cols, n_bins), dtype=np.int64)
+    size = np.zeros(n_bins, dtype=np.int64)
+    for i in range(ts.shape[0]):
+        b = (ts[i] - start) // step
+        size[b] += 1
+        for j in range(n_cols):
+            x = values[j, i]
+            if np.isnan(x):
+                continue
+            op = ops[j]
+            seen = nobs[j, b]
+            nobs[j, b] = seen + 1
+            if op == 0:
+                if seen == 0:
+                    out[j, b] = x
+            elif op == 1:
+                if seen == 0 or x > out[j, b]:
+                    out[j, b] = x
+            elif op == 2:
+                if seen == 0 or x < out[j, b]:
+                    out[j, b] = x
+            elif op == 3:
+                out[j, b] = x
+            else:
+                # suma compensada (Kahan), como group_sum / group_mean de pandas
+                acc = 0.0 if seen == 0 else out[j, b]
+                y = x - comp[j, b]
+                t = acc + y
+                comp[j, b] = t - acc - y
+                if comp[j, b] != comp[j, b]:
+                    comp[j, b] = 0.0
+                out[j, b] = t
+    for j in range(n_cols):
+        if ops[j] == 4:
+            for b in range(n_bins):
+                if nobs[j, b] == 0:
+                    out[j, b] = 0.0
+        elif ops[j] == 5:
+            for b in range(n_bins):
+                if nobs[j, b] > 0:
+                    out[j, b] = out[j, b] / nobs[j, b]
+    return out, size
+
+
+_ohlc_bins_jit = njit(cache=True)(_ohlc_bins_loop) if njit is not None else None
+
+
+def _kernel_supports(dtype: object, func: str) -> bool:
+    """Columnas que el kernel reproduce exactamente (float64 / enteros con signo)."""
+    if func not in _KERNEL_OPS:
+        return False
+    if isinstance(dtype, pd.ArrowDtype):
+        pa_type = dtype.pyarrow_dtype
+        if pa.types.is_float64(pa_type) or pa.types.is_signed_integer(pa_type):
+            return True
+        return pa.types.is_float32(pa_type) and func in _SELECT_OPS
+    if not isinstance(dtype, np.dtype):
+        return False
+    if dtype.kind == "i" or dtype == np.float64:
+        return True
+    return dtype == np.float32 and func in _SELECT_OPS
 
-    return agg
+
+def _restore_dtype(vals: np.ndarray, src: object, func: str, has_empty: bool) -> object:
+    """
+    Devuelve vals (float64) con el dtype que daría resample().agg() de pandas.
+    """
+    arrow = isinstance(src, pd.ArrowDtype)
+    np_src = src.numpy_dtype if arrow else src
+    if np_src.kind == "i" and func == "sum":
+        # enteros: suma en int64, vuelta al tipo original si cabe
+        out = vals.astype(np.int64)
+        info = np.iinfo(np_src)
+        if out.size == 0 or (out.min() >= info.min and out.max() <= info.max):
+            target = src
+        else:
+            target = "int64[pyarrow]" if arrow else np.int64
+        return pd.array(out, dtype=target) if arrow else out.astype(target)
+    if arrow:
+        int_mean = func == "mean" and np_src.kind == "i"
+        # NaN -> null al construir el array Arrow
+        return pd.array(vals, dtype="double[pyarrow]" if int_mean else src)
+    if np_src.kind == "f":
+        return vals.astype(src, copy=False)
+    # enteros numpy: mean -> float64; selección en el tipo original salvo que haya
+    # bins vacíos (NaN -> float64)
+    if func == "mean":
+        return vals
+    return vals if has_empty else vals.astype(src)
+
+
+def _resample_fixed(
+    df: pd.DataFrame,
+    rule: str,
+    agg: Dict[str, str],
+    kernel: Optional[Callable] = None,
+) -> Optional[Tuple[pd.DataFrame, np.ndarray]]:
+    """
+    Resample de frecuencia fija con el kernel de una pasada.
+    Devuelve (res, size por bin) o None si el caso no está cubierto (frecuencia
+    no fija, índice no UTC / desordenado / con NaT, dtypes no soportados).
+    Bins como pandas: origen 'start_day', cerrados y etiquetados a la izquierda.
+    """
+    kernel = kernel or _ohlc_bins_jit
+    idx = df.index
+    if kernel is None or len(idx) == 0 or idx.hasnans or not idx.is_monotonic_increasing:
+        return None
+    if idx.tz is not None and idx.tz not in _UTC_TZS:
+        return None
+    try:
+        offset = pd.tseries.frequencies.to_offset(rule)
+        step = offset.nanos
+    except ValueError:
+        return None
+    if step <= 0:
+        return None
+    cols: List[str] = list(agg)
+    dtypes = df.dtypes
+    if not all(_kernel_supports(dtypes[c], agg[c]) for c in cols):
+        return None
+
+    ts = idx.as_unit("ns").asi8
+    day_start = ts[0] - ts[0] % _DAY_NS
+    start = day_start + (ts[0] - day_start) // step * step
+    n_bins = int((ts[-1] - start) // step + 1)
+
+    # todo en float64 (exacto para enteros hasta 2**53: volúmenes / contadores)
+    values = np.empty((len(cols), len(ts)), dtype=np.float64)
+    for j, c in enumerate(cols):
+        values[j] = df[c].to_numpy(dtype=np.float64, na_value=np.nan)
+    ops = np.array([_KERNEL_OPS[agg[c]] for c in cols], dtype=np.int64)
+    out, size = kernel(ts, values, ops, start, step, n_bins)
+
+    has_empty = bool((size == 0).any())
+    bins = pd.date_range(
+        pd.Timestamp(start, tz=idx.tz), periods=n_bins, freq=offset, name=idx.name
+    ).as_unit(idx.unit)
+    res = pd.DataFrame(
+        {c: _restore_dtype(out[j], dtypes[c], agg[c], has_empty) for j, c in enumerate(cols)},
+        index=bins,
+    )
+    return res, size
 
 
 def resample_ohlc(
@@ -63,36 +243,71 @@ def resample_ohlc(
     if not isinstance(df.index, pd.DatetimeIndex):
         raise ValueError("DataFrame index must be a DatetimeIndex.")
 
-    agg = _build_agg_map(df)
+    # set de columnas construido una sola vez: las comprobaciones de pertenencia son O(1)
+    cols = set(df.columns)
+    has_close = "CLOSE" in cols
+
+    agg = _build_agg_map(df, cols)
     if not agg:
         logger.warning("No OHLC/VOLUME columns detected — returning original dataframe.")
         return df.copy()
 
-    # Resample usando el mapa de agregación principal
-    res = df.resample(rule).agg(agg)
-
-    # Para columnas numéricas no incluidas explícitamente, aplicar política
-    other_cols = [c for c in df.columns if c not in agg.keys()]
-    for c in other_cols:
-        if pd.api.types.is_numeric_dtype(df[c]):
-            if extra_numeric_policy == "mean":
-                res[c] = df[c].resample(rule).mean()
-            elif extra_numeric_policy == "sum":
-                res[c] = df[c].resample(rule).sum()
-            else:
-                # default: mean
-                res[c] = df[c].resample(rule).mean()
+    # Columnas numéricas no mapeadas: se agregan en la misma pasada según la política
+    # ('sum' o, por defecto, 'mean') en vez de un resample por columna
+    extra_func = "sum" if extra_numeric_policy == "sum" else "mean"
+    for c, dtype in df.dtypes.items():
+        if c not in agg and pd.api.types.is_numeric_dtype(dtype):
+            agg[c] = extra_func
+
+    # SYMBOL constante (caso habitual: un fichero por instrumento): no hace falta el
+    # groupby-last sobre objetos Python, se asigna el escalar tras el resample
+    symbol = None
+    if "SYMBOL" in agg and len(agg) > 1:
+        uniq = df["SYMBOL"].unique()
+        if len(uniq) == 1 and pd.notna(uniq[0]):
+            symbol = uniq[0]
+            symbol_pos = list(agg).index("SYMBOL")
+            del agg["SYMBOL"]
+
+    # Frecuencia fija + índice UTC ordenado: kernel JIT de una pasada (si numba está
+    # disponible); si no, un único resample con el mapa de agregación completo
+    fixed = _resample_fixed(df, rule, agg)
+    if fixed is not None:
+        res, sizes = fixed
+    else:
+        resampler = df.resample(rule)
+        res = resampler.agg(agg)
+        sizes = None
 
-    # Por seguridad: si SYMBOL estuvo presente en df pero no en res columns (pandas podría no crearla), intentar setearla
-    if "SYMBOL" in df.columns and "SYMBOL" not in res.columns:
-        res["SYMBOL"] = df["SYMBOL"].resample(rule).last()
+    if symbol is not None:
+        # intervalos vacíos quedan sin símbolo (como con "last"), salvo que se
+        # vayan a descartar igualmente por CLOSE NaN
+        empty = None
+        if not (drop_incomplete and has_close):
+            if sizes is None:
+                sizes = resampler.size().to_numpy()
+            empty = sizes == 0
+        symbol_dtype = df["SYMBOL"].dtype
+        if isinstance(symbol_dtype, pd.CategoricalDtype):
+            # mismo dtype (categorías) que la entrada: códigos, sin strings por fila
+            codes = np.full(len(res), symbol_dtype.categories.get_loc(symbol), dtype=np.int64)
+            if empty is not None:
+                codes[empty] = -1
+            symbol_col = pd.Categorical.from_codes(codes, dtype=symbol_dtype)
+        else:
+            symbol_col = pd.Series(symbol, index=res.index, dtype=object)
+            if empty is not None:
+                symbol_col[empty] = None
+        res.insert(symbol_pos, "SYMBOL", symbol_col)
 
     # Si pedimos drop_incomplete: eliminar intervalos donde CLOSE es NaN
-    if drop_incomplete and "CLOSE" in res.columns:
-        before = len(res)
-        res = res[~res["CLOSE"].isna()]
-        after = len(res)
-        logger.info("Dropped %d incomplete intervals during resample(%s).", before - after, rule)
+    # (datos completos, el caso común: sin máscara ni copia)
+    if drop_incomplete and has_close:
+        n_incomplete = int(res["CLOSE"].isna().sum())
+        if n_incomplete:
+            # res es propio (salida de agg): se recorta en sitio, sin rebind ni vista extra
+            res.dropna(subset=["CLOSE"], inplace=True)
+        logger.info("Dropped %d incomplete intervals during resample(%s).", n_incomplete, rule)
 
     # Mantener el tipo de índice (tz-aware) — no forzamos cambios de tz aquí.
     if keep_time_index:
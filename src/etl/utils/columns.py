@@ -0,0 +1,5 @@
+# src/etl/utils/columns.py
+"""Column-name constants shared across extract / transform / load."""
+
+# identifier columns: never renamed by normalization nor downcast by shrink_numeric
+PROTECTED = {"symbol", "ticker", "instrument", "pair"}
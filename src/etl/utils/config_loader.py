@@ -1,17 +1,32 @@
 # src/etl/utils/config_loader.py
 import os
+from functools import lru_cache
 from typing import Any, Dict
 
 import yaml  # type: ignore
 
+# libyaml C loader when PyYAML was built with it, pure-Python otherwise
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def _expand_env(val: str) -> str:
+    # expandvars only rewrites "$VAR" / "${VAR}"; skip strings that cannot contain one
+    if "$" not in val:
+        return val
     return os.path.expandvars(val)
 
 
-def load_yaml(path: str) -> Dict[str, Any]:
+@lru_cache(maxsize=8)
+def _parse_yaml(path: str, mtime: float) -> Any:
+    # mtime is part of the cache key so an edited file is parsed again
     with open(path, "r", encoding="utf-8") as f:
-        raw = yaml.safe_load(f)
+        return yaml.load(f, Loader=SafeLoader)
+
+
+def load_yaml(path: str) -> Dict[str, Any]:
+    # the parsed tree is cached and shared; walk() builds new containers, so callers
+    # never get (or mutate) the cached objects. Env vars are expanded on every call.
+    raw = _parse_yaml(path, os.path.getmtime(path))
 
     def walk(obj: Any) -> Any:
         if isinstance(obj, dict):
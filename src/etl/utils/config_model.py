@@ -1,10 +1,11 @@
 # src/etl/utils/config_model.py
-import json
 from pathlib import Path
 from typing import Dict, List, Optional
 
 import yaml  # type: ignore
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, field_validator
+
+from .config_loader import SafeLoader
 
 
 class IOConfig(BaseModel):
@@ -16,16 +17,19 @@ class IOConfig(BaseModel):
 
 class ParquetConfig(BaseModel):
     compression: str = "zstd"
+    compression_level: Optional[int] = 1
     engine: str = "pyarrow"
     partition_cols: Optional[List[str]] = None
-    row_group_size: Optional[int] = 65536
+    row_group_size: Optional[int] = 500_000
 
 
 class SchemaConfig(BaseModel):
     columns_map: Dict[str, List[str]]
     required_columns: List[str]
+    arrow_backend: bool = False
 
-    @validator("columns_map")
+    @field_validator("columns_map")
+    @classmethod
     def normalize_keys(cls, v: Dict[str, List[str]]) -> Dict[str, List[str]]:
         return {k.upper(): v for k, v in v.items()}
 
@@ -37,6 +41,7 @@ class TimezoneConfig(BaseModel):
     # allowed: "assume_utc", "require_source", "mark_needs_review"
     policy_if_na: str = "assume_utc"
 
+    @field_validator("policy_if_na")
     @classmethod
     def validate_policy(cls, v: str) -> str:
         allowed = {"assume_utc", "require_source", "mark_needs_review"}
@@ -55,14 +60,14 @@ class Config(BaseModel):
     parquet: ParquetConfig
     schema: SchemaConfig
     timezone: TimezoneConfig
-    resample: Optional[ResampleConfig]
-    export: Optional[Dict]
-    logging: Optional[Dict]
+    resample: Optional[ResampleConfig] = None
+    export: Optional[Dict] = None
+    logging: Optional[Dict] = None
 
 
 def load_config_pydantic(path: str = "config/default.yml") -> Config:
     with open(path, "r", encoding="utf-8") as f:
-        raw = yaml.safe_load(f)
+        raw = yaml.load(f, Loader=SafeLoader)
 
-    raw_s = json.loads(json.dumps(raw))  # evita mutación del dict
-    return Config(**raw_s)
+    # model_validate no muta raw: no hace falta copiarlo antes
+    return Config.model_validate(raw)
@@ -1,12 +1,39 @@
 import logging
+import multiprocessing
 import os
+from contextlib import contextmanager
 from logging import Logger
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Any, Iterator, Optional
 
 LOG_DIR = os.getenv("LOG_DIR", "logs")
-os.makedirs(LOG_DIR, exist_ok=True)
 LOG_FILE = os.path.join(LOG_DIR, "etl.log")
 
+_FMT = logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+
+class _LazyRotatingFileHandler(RotatingFileHandler):
+    """RotatingFileHandler that creates the log dir when the file is first opened."""
+
+    def _open(self):  # type: ignore[no-untyped-def]
+        os.makedirs(os.path.dirname(self.baseFilename), exist_ok=True)
+        return super()._open()
+
+
+# one handler for etl.log shared by every logger: a single rotation state per process
+_file_handler: Optional[logging.Handler] = None
+
+
+def _shared_file_handler() -> logging.Handler:
+    global _file_handler
+    if _file_handler is None:
+        # delay=True: nothing is opened (nor the dir created) until the first record
+        _file_handler = _LazyRotatingFileHandler(
+            LOG_FILE, maxBytes=5_000_000, backupCount=3, delay=True
+        )
+        _file_handler.setFormatter(_FMT)
+    return _file_handler
+
 
 def get_logger(name: str = __name__) -> Logger:
     logger = logging.getLogger(name)
@@ -14,14 +41,41 @@ def get_logger(name: str = __name__) -> Logger:
         return logger
     logger.setLevel(logging.INFO)
 
-    fmt = logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
-
     sh = logging.StreamHandler()
-    sh.setFormatter(fmt)
+    sh.setFormatter(_FMT)
     logger.addHandler(sh)
 
-    fh = RotatingFileHandler(LOG_FILE, maxBytes=5_000_000, backupCount=3)
-    fh.setFormatter(fmt)
-    logger.addHandler(fh)
+    logger.addHandler(_shared_file_handler())
 
     return logger
+
+
+@contextmanager
+def worker_log_queue() -> Iterator[Any]:
+    """
+    Parent side of multi-process logging. Yields a queue to hand to the pool
+    initializer (which calls log_to_queue); records sent by the workers are written
+    to etl.log by this process only, so rotation never happens across processes.
+    """
+    queue: Any = multiprocessing.Queue()
+    listener = QueueListener(queue, _shared_file_handler())
+    listener.start()
+    try:
+        yield queue
+    finally:
+        # workers have exited (pool shut down): drain what is left, then stop
+        listener.stop()
+
+
+def log_to_queue(queue: Any) -> None:
+    """
+    Worker side: send etl.log records to the parent's queue instead of opening the
+    file. Loggers created before (inherited or at import) and after are rerouted.
+    """
+    global _file_handler
+    old = _file_handler
+    _file_handler = QueueHandler(queue)
+    for logger in list(logging.root.manager.loggerDict.values()):
+        if isinstance(logger, Logger) and old is not None and old in logger.handlers:
+            logger.removeHandler(old)
+            logger.addHandler(_file_handler)
@@ -1,30 +1,101 @@
 # src/etl/utils/reporting.py
 from __future__ import annotations
 
-import json
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+import numpy as np
+import orjson
 import pandas as pd
 
 from ..utils.logger import get_logger
 
-logger = get_logger("Reporting")
+# optional: C moving-window kernels / JIT (pip install etl[fast])
+try:
+    import bottleneck as bn
+except ImportError:  # pragma: no cover - depends on the environment
+    bn = None
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - depends on the environment
+    njit = None
 
+logger = get_logger("Reporting")
 
-def _safe_mean(s: pd.Series) -> Optional[float]:
-    s2 = s.dropna()
-    if s2.empty:
-        return None
-    return float(s2.mean())
+# column lists longer than this are truncated to the first _REPORT_COLUMNS_HEAD names
+_MAX_REPORT_COLUMNS = 500
+_REPORT_COLUMNS_HEAD = 50
 
 
 def _to_float_or_none(x: Any) -> Optional[float]:
-    return None if x is None else float(x)
+    # skipna aggregations of an all-NaN column return NaN / pd.NA: report those as None
+    return None if x is None or pd.isna(x) else float(x)
+
+
+def _move_mean(arr: np.ndarray, window: int) -> np.ndarray:
+    """
+    Trailing moving mean ignoring NaNs (rolling(window, min_periods=1).mean()).
+    Uses bottleneck when available, otherwise pandas' rolling mean itself: a plain
+    cumulative-sum difference drifts from it as the series grows.
+    """
+    if bn is not None:
+        return bn.move_mean(arr, window, min_count=1)
+    return pd.Series(arr).rolling(window, min_periods=1).mean().to_numpy()
+
+
+def _sma_summary_loop(close: np.ndarray, window: int) -> Tuple[float, int, float, float]:
+    """
+    One pass over CLOSE: running NaN-skipping window sum (add newest, drop oldest)
+    -> (last, nan_count, min, max) of rolling(window, min_periods=1).mean().
+    Written for numba; no fastmath, the NaN checks must survive compilation.
+    """
+    total = 0.0
+    count = 0
+    last = np.nan
+    nan_count = 0
+    lo = np.inf
+    hi = -np.inf
+    for i in range(close.shape[0]):
+        x = close[i]
+        if not np.isnan(x):
+            total += x
+            count += 1
+        if i >= window:
+            old = close[i - window]
+            if not np.isnan(old):
+                total -= old
+                count -= 1
+        if count > 0:
+            m = total / count
+            last = m
+            if m < lo:
+                lo = m
+            if m > hi:
+                hi = m
+        else:
+            total = 0.0  # empty window: drop accumulated rounding error
+            nan_count += 1
+    return last, nan_count, lo, hi
+
+
+_sma_summary_jit = njit(cache=True)(_sma_summary_loop) if njit is not None else None
+
+
+def _sma_summary(close: np.ndarray, window: int) -> Tuple[float, int, float, float]:
+    """(last, nan_count, min, max) of the SMA; last/min/max are NaN if it has no values."""
+    if _sma_summary_jit is not None:
+        return _sma_summary_jit(close, window)
+    sma = _move_mean(close, window)
+    non_na = sma[~np.isnan(sma)]
+    if non_na.size == 0:
+        return np.nan, int(sma.size), np.nan, np.nan
+    return float(non_na[-1]), int(sma.size - non_na.size), float(non_na.min()), float(non_na.max())
 
 
 def data_quality_report(
     df: pd.DataFrame,
+    idx: Optional[pd.Index] = None,
     *,
     compute_indicators: bool = True,
     sma_windows: Iterable[int] = (10, 50),
@@ -33,45 +104,69 @@ def data_quality_report(
     Produce a data-quality + light indicators report for a normalized DataFrame.
 
     Report fields:
-      - rows, start, end, columns
+      - rows, start, end, columns (first 50 names + total if more than 500)
       - nans_per_column
       - dups_timestamps
       - candles_count
       - mean_range, max_range (if HIGH/LOW exist)
       - close_min/close_max and simple jump heuristic (suspicious_price_jump)
       - indicators: SMA_{w} summary (last/min/max/nans)
+
+    idx: df.index, if the caller already holds it.
     """
+    if idx is None:
+        idx = df.index
+    # sorted DatetimeIndex (the normalized case): bounds are the ends, repeats adjacent
+    sorted_dt = isinstance(idx, pd.DatetimeIndex) and idx.is_monotonic_increasing
+
     report: Dict = {}
     report["rows"] = int(len(df))
-    report["start"] = str(df.index.min()) if len(df) > 0 else None
-    report["end"] = str(df.index.max()) if len(df) > 0 else None
-    report["columns"] = list(df.columns)
+    if len(df) == 0:
+        report["start"] = report["end"] = None
+    elif sorted_dt:
+        report["start"], report["end"] = str(idx[0]), str(idx[-1])
+    else:
+        report["start"], report["end"] = str(idx.min()), str(idx.max())
+    columns = df.columns.tolist()
+    if len(columns) > _MAX_REPORT_COLUMNS:
+        # very wide frames: keep the report (and its JSON) bounded
+        columns = columns[:_REPORT_COLUMNS_HEAD] + [f"...({len(columns)} total)"]
+    report["columns"] = columns
 
     # NaNs per column
-    report["nans_per_column"] = {c: int(df[c].isna().sum()) for c in df.columns}
-
-    # duplicated timestamps
-    report["dups_timestamps"] = int(df.index.duplicated().sum())
+    # count() reduces non-nulls per column without materializing a boolean mask frame
+    n_rows = len(df)
+    report["nans_per_column"] = {c: n_rows - int(n) for c, n in df.count().items()}
+
+    # duplicated timestamps. Normalized frames are sorted: repeats are adjacent, so one
+    # int64 compare of neighbours replaces hashing; otherwise hash the int64 view.
+    if sorted_dt:
+        vals = idx.asi8
+        report["dups_timestamps"] = int(np.count_nonzero(vals[1:] == vals[:-1]))
+    else:
+        keys = idx.asi8 if isinstance(idx, pd.DatetimeIndex) else idx
+        report["dups_timestamps"] = int(pd.Index(keys).duplicated().sum())
 
     # candles count (same as rows but explicit for clarity)
     report["candles_count"] = int(len(df))
 
     # range metrics (HIGH - LOW)
     if {"HIGH", "LOW"}.issubset(df.columns):
-        rng = df["HIGH"] - df["LOW"]
-        report["mean_range"] = _safe_mean(rng)
-        report["max_range"] = _to_float_or_none(rng.max(skipna=True)) if len(rng) > 0 else None
+        rng_stats = (df["HIGH"] - df["LOW"]).agg(["mean", "max"])
+        report["mean_range"] = _to_float_or_none(rng_stats["mean"])
+        report["max_range"] = _to_float_or_none(rng_stats["max"])
     else:
         report["mean_range"] = None
         report["max_range"] = None
 
     # simple CLOSE stats and outlier heuristic
     if "CLOSE" in df.columns:
-        closes = df["CLOSE"].dropna()
-        if not closes.empty:
-            close_min = float(closes.min())
-            close_max = float(closes.max())
-            median = float(closes.median()) if len(closes) > 0 else None
+        close_s = df["CLOSE"]
+        if close_s.count() > 0:
+            cstats = close_s.agg(["min", "max", "median"])
+            close_min = float(cstats["min"])
+            close_max = float(cstats["max"])
+            median = float(cstats["median"])
 
             report["close_min"] = close_min
             report["close_max"] = close_max
@@ -106,20 +201,24 @@ def data_quality_report(
     # indicators (lightweight): SMA summaries only (no series dumped)
     report["indicators"] = {}
     if compute_indicators and "CLOSE" in df.columns and len(df) > 0:
-        close = df["CLOSE"]
+        # plain float64 ndarray: no Series wrapping per window
+        close = df["CLOSE"].to_numpy(dtype=np.float64, na_value=np.nan)
         for w in tuple(sma_windows):
             try:
                 w_int = int(w)
             except Exception:
                 logger.warning("Invalid SMA window: %s. Skipping.", w)
                 continue
-            sma = close.rolling(window=w_int, min_periods=1).mean()
-            sma_non_na = sma.dropna()
+            if w_int < 1:
+                logger.warning("Invalid SMA window: %s. Skipping.", w)
+                continue
+            last, nan_count, sma_min, sma_max = _sma_summary(close, w_int)
+            has_values = nan_count < close.size
             report["indicators"][f"SMA_{w_int}"] = {
-                "last": _to_float_or_none(sma_non_na.iloc[-1]) if not sma_non_na.empty else None,
-                "nan_count": int(sma.isna().sum()),
-                "min": _to_float_or_none(sma_non_na.min()) if not sma_non_na.empty else None,
-                "max": _to_float_or_none(sma_non_na.max()) if not sma_non_na.empty else None,
+                "last": float(last) if has_values else None,
+                "nan_count": int(nan_count),
+                "min": float(sma_min) if has_values else None,
+                "max": float(sma_max) if has_values else None,
             }
 
     # small summary notes for humans (optional)
@@ -137,6 +236,11 @@ def data_quality_report(
 
 def save_report(report: Dict, out_path: Path) -> None:
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(out_path, "w", encoding="utf-8") as fh:
-        json.dump(report, fh, indent=2, ensure_ascii=False)
+    # orjson: UTF-8 bytes (like ensure_ascii=False), numpy scalars handled natively
+    out_path.write_bytes(
+        orjson.dumps(
+            report,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        )
+    )
     logger.info("Wrote quality report: %s", out_path)
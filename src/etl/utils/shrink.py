@@ -0,0 +1,38 @@
+# src/etl/utils/shrink.py
+from __future__ import annotations
+
+from typing import Iterable
+
+import pandas as pd
+
+from .columns import PROTECTED
+from .logger import get_logger
+
+logger = get_logger("Shrink")
+
+
+def shrink_numeric(df: pd.DataFrame, protected: Iterable[str] = PROTECTED) -> pd.DataFrame:
+    """
+    Downcast numeric columns in place to the smallest dtype that holds their values.
+
+    - integers: pd.to_numeric(downcast="integer") (lossless by construction).
+    - floats: downcast to float32 only when every value survives the round trip,
+      so prices with more significant digits than float32 keeps stay float64.
+
+    Columns whose lowercase name is in `protected` (identifiers) are skipped.
+    Returns the same DataFrame.
+    """
+    skip = {p.lower() for p in protected}
+    for c in df.columns:
+        if str(c).lower() in skip:
+            continue
+        s = df[c]
+        if pd.api.types.is_bool_dtype(s):
+            continue
+        if pd.api.types.is_integer_dtype(s):
+            df[c] = pd.to_numeric(s, downcast="integer")
+        elif pd.api.types.is_float_dtype(s):
+            down = pd.to_numeric(s, downcast="float")
+            if down.dtype != s.dtype and down.astype(s.dtype).equals(s):
+                df[c] = down
+    return df
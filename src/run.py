@@ -7,19 +7,26 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import timezone, tzinfo
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
+from zoneinfo import ZoneInfo
 
+import numpy as np
 import pandas as pd
 
 from src.etl.extract.extractor import Extractor
-from src.etl.load.exporter import append_export_log, write_parquet_with_metadata
+from src.etl.load.exporter import ExportLog, write_parquet_with_metadata
 from src.etl.transform.gaps import repair_gaps
 from src.etl.transform.normalize import normalize_df
 from src.etl.transform.resample import resample_ohlc
 from src.etl.utils.config_loader import get_config
-from src.etl.utils.logger import get_logger
+from src.etl.utils.logger import get_logger, log_to_queue, worker_log_queue
 from src.etl.utils.reporting import data_quality_report, save_report
+from src.etl.utils.shrink import shrink_numeric
 
 logger = get_logger("ETL_Run")
 
@@ -28,21 +35,32 @@ def ensure_dir(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
+# lowercase column names that may carry the instrument symbol
+_SYMBOL_CANDIDATES = frozenset(("symbol", "ticker", "pair", "instrument", "sym"))
+
+
+# UTC tz objects pandas/normalize hand back (tz_convert("UTC") vs ZoneInfo("UTC"))
+_UTC_TZS = (timezone.utc, ZoneInfo("UTC"))
+
+
+def _is_utc(tz: tzinfo) -> bool:
+    # identity/attribute checks instead of str(tz); `zone` covers pytz objects
+    return tz in _UTC_TZS or getattr(tz, "key", None) == "UTC" or getattr(tz, "zone", None) == "UTC"
+
+
 def infer_symbol_from_df(df: pd.DataFrame, fallback: str) -> str:
     """
     Detect a symbol/ticker column in the df and return its first value.
     If none found, return fallback.
     Normalizes to uppercase string.
     """
-    candidates = ("symbol", "ticker", "pair", "instrument", "sym")
-    for col in df.columns:
-        if col.lower() in candidates:
-            try:
-                val = df[col].iloc[0]
-                if pd.notna(val):
-                    return str(val).upper()
-            except Exception:
-                continue
+    for col in (c for c in df.columns if c.lower() in _SYMBOL_CANDIDATES):
+        try:
+            val = df[col].iat[0]
+            if pd.notna(val):
+                return str(val).upper()
+        except Exception:
+            continue
     # fallback from provided basename (e.g. "EURUSD_20240101_20240131" -> "EURUSD")
     if isinstance(fallback, str) and "_" in fallback:
         return fallback.split("_")[0].upper()
@@ -57,12 +75,94 @@ def infer_symbol_from_df(df: pd.DataFrame, fallback: str) -> str:
 # NOTE: write_parquet logic replaced by specialized exporter.write_parquet_with_metadata
 
 
+def _resample_and_write(
+    normalized: pd.DataFrame,
+    tf: str,
+    out_dir: Path,
+    basename: str,
+    gap_policy: Dict,
+    export_kwargs: Dict,
+    meta_base: Dict,
+) -> Dict:
+    """
+    Gap-repair (if a policy is given), resample `normalized` to `tf` and write it.
+    meta_base holds the per-input exporter metadata (symbol, source_basename).
+    Returns the export-log entry.
+    """
+    # Before resample: attempt gap repair at the target frequency if gap policy provided
+    res = normalized
+    try:
+        if gap_policy:
+            repaired, gap_report = repair_gaps(
+                normalized,
+                rule=tf,
+                use_ffill_for=gap_policy.get("use_ffill_for"),
+                interpolate_prices=gap_policy.get("interpolate_prices", True),
+                short_gap_minutes=gap_policy.get("short_gap_minutes", 5),
+            )
+            # attach gap report to normalized attrs for exporter metadata
+            repaired.attrs["gap_report"] = gap_report
+            res = repaired
+    except Exception as e:
+        logger.exception("Gap repair failed for timeframe %s: %s", tf, e)
+
+    # Now perform resample on the (possibly repaired) dataframe
+    res = resample_ohlc(
+        res,
+        rule=tf,
+    )
+
+    # attach metadata for exporter
+    res.attrs["symbol"] = meta_base["symbol"]
+    res.attrs["timeframe"] = tf
+    # name timeframes nicely (1T -> 1m)
+    tf_suffix = tf.replace("T", "m").lower()
+    out_file = out_dir / f"{basename}_{tf_suffix}.parquet"
+
+    export_report = write_parquet_with_metadata(
+        res, out_file, metadata={**meta_base, "timeframe": tf_suffix}, **export_kwargs
+    )
+
+    logger.info("Resampled to %s, rows=%d -> wrote %s", tf, len(res), out_file)
+    return {
+        "basename": basename,
+        "timeframe": tf_suffix,
+        "out_path": str(out_file),
+        "export_report": export_report,
+    }
+
+
+# normalized frame of the input being exported, set once per worker process
+_WORKER_FRAME: Optional[pd.DataFrame] = None
+
+# fork start method: pool workers get the initializer args (the normalized frame)
+# from the parent's memory, copy-on-write, instead of a pickled copy each.
+# None (platform default, e.g. spawn) where fork is not available.
+_FORK_CONTEXT = (
+    multiprocessing.get_context("fork")
+    if "fork" in multiprocessing.get_all_start_methods()
+    else None
+)
+
+
+def _init_timeframe_worker(normalized: pd.DataFrame, log_queue: Any) -> None:
+    global _WORKER_FRAME
+    _WORKER_FRAME = normalized
+    log_to_queue(log_queue)
+
+
+def _timeframe_worker(tf: str, *args: Any) -> Dict:
+    assert _WORKER_FRAME is not None
+    return _resample_and_write(_WORKER_FRAME, tf, *args)
+
+
 def process_dataframe(
     df: pd.DataFrame,
     cfg: Dict,
     source_tz: Optional[str],
     basename: str,
     out_dir: Path,
+    max_workers: Optional[int] = None,
 ) -> None:
     """
     Full pipeline for a single DataFrame:
@@ -70,9 +170,11 @@ def process_dataframe(
      - resample (each timeframe)
      - write parquet files (one per timeframe)
      - write quality report JSON
+
+    max_workers caps the per-timeframe process pool (default: cpu count).
     """
     try:
-        logger.info(f"Processing input: {basename}")
+        logger.info("Processing input: %s", basename)
 
         # Normalize column names & types + timezone + dedupe
         normalized = None
@@ -83,6 +185,7 @@ def process_dataframe(
                 required_columns=cfg["schema"]["required_columns"],
                 source_tz=source_tz,
                 target_tz=cfg["timezone"]["target"],
+                arrow_backend=bool(cfg["schema"].get("arrow_backend", False)),
             )
         except Exception as e:
             # Log full exception and re-raise so caller knows normalization failed.
@@ -105,27 +208,32 @@ def process_dataframe(
 
         # ensure sorted
         # === Timezone post-check ===
+        idx = normalized.index
         try:
-            tz = normalized.index.tz
+            tz = idx.tz
             if tz is None:
                 logger.error(
                     "[TZ-ERROR] Normalized DF for %s is tz-naive AFTER normalization.", basename
                 )
+            elif _is_utc(tz):
+                logger.info("[TZ-CHECK] OK — Index timezone is UTC.")
             else:
-                tz_str = str(tz)
-                if tz_str != "UTC" and tz_str.lower() != "utc":
-                    logger.error(
-                        "[TZ-ERROR] Normalized DF for %s has tz=%s, expected UTC.", basename, tz_str
-                    )
-                else:
-                    logger.info("[TZ-CHECK] OK — Index timezone is UTC.")
+                logger.error(
+                    "[TZ-ERROR] Normalized DF for %s has tz=%s, expected UTC.", basename, tz
+                )
         except Exception as e:
             logger.exception("[TZ-CHECK] Exception while checking timezone for %s: %s", basename, e)
         # === END TZ CHECK ===
 
+        # smaller dtypes before the per-timeframe work: every gap repair / resample copy
+        # below is proportionally smaller. Lossless only (prices stay float64 unless
+        # float32 round-trips exactly); the caller's df is not touched.
+        shrink_numeric(normalized)
+
         # === QA REPORT (FASE 10) ===
         qa_report = data_quality_report(
             normalized,
+            idx,
             compute_indicators=True,
             sma_windows=(10, 50),
         )
@@ -133,7 +241,7 @@ def process_dataframe(
         report_path = out_dir / "report.json"
         ensure_dir(report_path.parent)
         save_report(qa_report, report_path)
-        logger.info(f"[QA] Wrote advanced quality report: {report_path}")
+        logger.info("[QA] Wrote advanced quality report: %s", report_path)
         # =============================
 
         # Resample and write for each timeframe in config using exporter
@@ -141,116 +249,107 @@ def process_dataframe(
         timeframes = resample_cfg.get("timeframes", [])
         parquet_cfg = cfg.get("parquet", {})
         compression = parquet_cfg.get("compression", "zstd")
+        # fast codec level by default: export CPU is dominated by compression
+        compression_level = parquet_cfg.get("compression_level", 1)
+        row_group_size = parquet_cfg.get("row_group_size") or 500_000
         engine = parquet_cfg.get("engine", "pyarrow")
         partition_cols = parquet_cfg.get("partition_cols")
 
         export_log_dir = Path(cfg["io"].get("reports_path", "data/reports")) / "exports"
         ensure_dir(export_log_dir)
 
-        if not timeframes:
-            out_file = out_dir / f"{basename}_raw.parquet"
-            try:
-                # Run gap repair on raw if configured
-                gap_policy = resample_cfg.get("gap_policy", {}) or {}
-                if gap_policy:
-                    try:
-                        repaired, gap_report = repair_gaps(
-                            normalized,
-                            rule="1T",
-                            use_ffill_for=gap_policy.get("use_ffill_for"),
-                            interpolate_prices=gap_policy.get("interpolate_prices", True),
-                            short_gap_minutes=gap_policy.get("short_gap_minutes", 5),
-                        )
-                        # attach report and replace normalized for export
-                        repaired.attrs["gap_report"] = gap_report
-                        normalized = repaired
-                    except Exception as e:
-                        logger.exception("Gap repair failed on raw dataframe: %s", e)
-                meta = {
-                    "symbol": normalized.attrs.get("symbol", None),
-                    "timeframe": "raw",
-                    "source_basename": basename,
-                }
-                export_report = write_parquet_with_metadata(
-                    normalized,
-                    out_file,
-                    compression=compression,
-                    engine=engine,
-                    partition_cols=partition_cols,
-                    metadata=meta,
-                )
-                export_entry = {
-                    "basename": basename,
-                    "timeframe": "raw",
-                    "out_path": str(out_file),
-                    "export_report": export_report,
-                }
-                append_export_log(export_log_dir, export_entry)
-            except Exception as e:
-                logger.error("Export failed for %s: %s", out_file, e)
-        else:
-            for tf in timeframes:
+        # exporter metadata shared by every output of this input
+        meta_base = {"symbol": normalized.attrs.get("symbol"), "source_basename": basename}
+
+        # one buffered handle for all export-log entries of this input
+        with ExportLog(export_log_dir) as export_log:
+            if not timeframes:
+                out_file = out_dir / f"{basename}_raw.parquet"
                 try:
-                    # Before resample: attempt gap repair at the target frequency if gap policy provided
-                    res = normalized
+                    # Run gap repair on raw if configured
                     gap_policy = resample_cfg.get("gap_policy", {}) or {}
-                    try:
-                        if gap_policy:
+                    if gap_policy:
+                        try:
                             repaired, gap_report = repair_gaps(
                                 normalized,
-                                rule=tf,
+                                rule="1T",
                                 use_ffill_for=gap_policy.get("use_ffill_for"),
                                 interpolate_prices=gap_policy.get("interpolate_prices", True),
                                 short_gap_minutes=gap_policy.get("short_gap_minutes", 5),
                             )
-                            # attach gap report to normalized attrs for exporter metadata
+                            # attach report and replace normalized for export
                             repaired.attrs["gap_report"] = gap_report
-                            res = repaired
-                    except Exception as e:
-                        logger.exception("Gap repair failed for timeframe %s: %s", tf, e)
-
-                    # Now perform resample on the (possibly repaired) dataframe
-                    res = resample_ohlc(
-                        res,
-                        rule=tf,
-                    )
-
-                    # attach metadata for exporter
-                    res.attrs["symbol"] = normalized.attrs.get("symbol")
-                    res.attrs["timeframe"] = tf
-                    if "gap_report" in res.attrs:
-                        pass  # already set during gap repair
-                    # name timeframes nicely (1T -> 1m)
-                    tf_suffix = tf.replace("T", "m").lower()
-                    out_file = out_dir / f"{basename}_{tf_suffix}.parquet"
-
-                    meta = {
-                        "symbol": normalized.attrs.get("symbol", None),
-                        "timeframe": tf_suffix,
-                        "source_basename": basename,
-                    }
+                            normalized = repaired
+                        except Exception as e:
+                            logger.exception("Gap repair failed on raw dataframe: %s", e)
                     export_report = write_parquet_with_metadata(
-                        res,
+                        normalized,
                         out_file,
                         compression=compression,
+                        compression_level=compression_level,
+                        row_group_size=row_group_size,
                         engine=engine,
                         partition_cols=partition_cols,
-                        metadata=meta,
+                        metadata={**meta_base, "timeframe": "raw"},
                     )
                     export_entry = {
                         "basename": basename,
-                        "timeframe": tf_suffix,
+                        "timeframe": "raw",
                         "out_path": str(out_file),
                         "export_report": export_report,
                     }
-                    append_export_log(export_log_dir, export_entry)
-
-                    logger.info(f"Resampled to {tf}, rows={len(res)} -> wrote {out_file}")
+                    export_log.append(export_entry)
                 except Exception as e:
-                    logger.error(f"Failed resample for timeframe {tf}: {e}")
+                    logger.error("Export failed for %s: %s", out_file, e)
+            else:
+                gap_policy = resample_cfg.get("gap_policy", {}) or {}
+                export_kwargs = {
+                    "compression": compression,
+                    "compression_level": compression_level,
+                    "row_group_size": row_group_size,
+                    "engine": engine,
+                    "partition_cols": partition_cols,
+                }
+                task_args = (out_dir, basename, gap_policy, export_kwargs, meta_base)
+                workers = min(len(timeframes), max_workers or os.cpu_count() or 1)
+
+                if workers <= 1:
+                    for tf in timeframes:
+                        try:
+                            export_log.append(_resample_and_write(normalized, tf, *task_args))
+                        except Exception as e:
+                            logger.error("Failed resample for timeframe %s: %s", tf, e)
+                else:
+                    # timeframes are independent and CPU-bound (resample + compression):
+                    # one process each. Workers inherit the frame through fork (see
+                    # _FORK_CONTEXT; pickled once per worker only where fork is missing);
+                    # export-log entries are written here, in timeframe order.
+                    # Worker log records reach etl.log through this process.
+                    with (
+                        worker_log_queue() as log_queue,
+                        ProcessPoolExecutor(
+                            max_workers=workers,
+                            mp_context=_FORK_CONTEXT,
+                            initializer=_init_timeframe_worker,
+                            initargs=(normalized, log_queue),
+                        ) as pool,
+                    ):
+                        futures = [
+                            pool.submit(_timeframe_worker, tf, *task_args) for tf in timeframes
+                        ]
+                        for tf, fut in zip(timeframes, futures):
+                            try:
+                                export_log.append(fut.result())
+                            except Exception as e:
+                                logger.error("Failed resample for timeframe %s: %s", tf, e)
 
     except Exception as exc:
-        logger.exception(f"Failed processing {basename}: {exc}")
+        logger.exception("Failed processing %s: %s", basename, exc)
+
+
+def _process_one(task: Tuple[pd.DataFrame, Dict, Optional[str], str, Path]) -> None:
+    # file-level worker: inputs already run in parallel, so timeframes stay inline
+    process_dataframe(*task, max_workers=1)
 
 
 def main(config_path: str, dry_run: bool = True) -> None:
@@ -272,7 +371,9 @@ def main(config_path: str, dry_run: bool = True) -> None:
         f"Extraction finished. {len(items)} files loaded (some files may have been quarantined)."
     )
 
-    # Process each DataFrame
+    # Scan each DataFrame (symbol, basename, source tz); processing runs afterwards
+    tasks: List[Tuple[pd.DataFrame, Dict, Optional[str], str, Path]] = []
+    used_basenames: Set[str] = set()
     for i, item in enumerate(items):
         df = item["df"]
         meta = item.get("meta", {})
@@ -294,33 +395,52 @@ def main(config_path: str, dry_run: bool = True) -> None:
                 dt_col = next(
                     c for c in df.columns if c.lower() in ("datetime", "timestamp", "time")
                 )
-                start = pd.to_datetime(df[dt_col], errors="coerce").min()
-                end = pd.to_datetime(df[dt_col], errors="coerce").max()
+                # parse once (only if not already datetime64, e.g. parquet / Arrow CSV
+                # input), take both ends from the same result; sorted -> first/last
+                dt_values = df[dt_col]
+                if pd.api.types.is_datetime64_any_dtype(dt_values):
+                    parsed = dt_values
+                else:
+                    parsed = pd.to_datetime(dt_values, errors="coerce")
+                if len(parsed) and parsed.is_monotonic_increasing:
+                    start, end = parsed.iloc[0], parsed.iloc[-1]
+                else:
+                    start, end = parsed.min(), parsed.max()
                 if pd.notna(start) and pd.notna(end):
                     basename = f"{basename}_{start.strftime('%Y%m%d')}_{end.strftime('%Y%m%d')}"
         except Exception:
             pass
 
         # === NEW: infer and inject SYMBOL column if missing ===
-        inferred_symbol = infer_symbol_from_df(df, basename)
         # If any variant of symbol exists, prefer it; else create SYMBOL
-        symbol_cols = [
-            c for c in df.columns if c.lower() in ("symbol", "ticker", "pair", "instrument", "sym")
-        ]
-        if symbol_cols:
+        col = next((c for c in df.columns if c.lower() in _SYMBOL_CANDIDATES), None)
+        # SYMBOL as category: one string per distinct symbol + small integer codes per
+        # row (written as a dictionary-encoded parquet column)
+        if col is not None:
             # normalize existing symbol column to SYMBOL uppercase
-            col = symbol_cols[0]
-            df["SYMBOL"] = df[col].astype(str).str.upper()
+            df["SYMBOL"] = df[col].astype(str).str.upper().astype("category")
         else:
-            df["SYMBOL"] = inferred_symbol
-
-        # ensure SYMBOL is present and uppercase
-        df["SYMBOL"] = df["SYMBOL"].astype(str).str.upper()
+            # no symbol column to scan (what infer_symbol_from_df would fall back to):
+            # symbol from the basename, e.g. "EURUSD_20240101_20240131" -> "EURUSD"
+            inferred_symbol = basename.split("_")[0].upper()
+            df["SYMBOL"] = pd.Categorical.from_codes(
+                np.zeros(len(df), dtype=np.int8), categories=[inferred_symbol]
+            )
         # === END NEW ===
 
+        # inputs run in parallel: two files with the same symbol and date range must
+        # not write to the same output paths
+        if basename in used_basenames:
+            base, n = basename, 1
+            while f"{base}_{n}" in used_basenames:
+                n += 1
+            basename = f"{base}_{n}"
+            logger.warning("Duplicate output basename '%s': using '%s'.", base, basename)
+        used_basenames.add(basename)
+
         out_dir_for_df = processed_path / basename
         if dry_run:
-            logger.info(f"[dry-run] Would process '{basename}' -> output dir: {out_dir_for_df}")
+            logger.info("[dry-run] Would process '%s' -> output dir: %s", basename, out_dir_for_df)
             continue
 
         # actual processing
@@ -329,13 +449,24 @@ def main(config_path: str, dry_run: bool = True) -> None:
         meta_source_tz = meta.get("source_tz")
         source_to_use = meta_source_tz or config_source_default
 
-        process_dataframe(
-            df,
-            cfg,
-            source_tz=source_to_use,
-            basename=basename,
-            out_dir=out_dir_for_df,
-        )
+        tasks.append((df, cfg, source_to_use, basename, out_dir_for_df))
+
+    # inputs are independent pipelines: one process per file when there are several
+    workers = min(len(tasks), os.cpu_count() or 1)
+    if workers <= 1:
+        for task in tasks:
+            process_dataframe(*task)
+    else:
+        # worker log records are written to etl.log by this process (no cross-process
+        # rotation of the same file)
+        with (
+            worker_log_queue() as log_queue,
+            ProcessPoolExecutor(
+                max_workers=workers, initializer=log_to_queue, initargs=(log_queue,)
+            ) as pool,
+        ):
+            for _ in pool.map(_process_one, tasks):
+                pass
 
     logger.info("ETL run finished.")
 
@@ -1,3 +1,6 @@
+import os
+from pathlib import Path
+
 from src.etl.utils.config_loader import get_config
 
 
@@ -6,3 +9,18 @@ def test_config_loads() -> None:
 
     assert cfg["io"]["raw_path"].startswith("tests")
     assert "OPEN" in cfg["schema"]["columns_map"]
+
+
+def test_config_cache_picks_up_edits(tmp_path: Path) -> None:
+    path = tmp_path / "cfg.yml"
+    text = open("config/testing.yml", encoding="utf-8").read()
+    path.write_text(text)
+    cfg = get_config(str(path))
+    # returned trees are copies: mutating one must not leak into the cache
+    cfg["io"]["raw_path"] = "mutated"
+    assert get_config(str(path))["io"]["raw_path"].startswith("tests")
+
+    path.write_text(text.replace("compression:", "compression: snappy #", 1))
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert get_config(str(path))["parquet"]["compression"] == "snappy"
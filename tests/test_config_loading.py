@@ -8,3 +8,26 @@ def test_load_default_config() -> None:
     assert "schema" in cfg
     assert cfg["io"]["raw_path"] != ""
     assert cfg["parquet"]["compression"] in ["zstd", "snappy", "gzip"]
+
+
+def test_every_config_file_validates() -> None:
+    from pathlib import Path
+
+    from src.etl.utils.config_model import load_config_pydantic
+
+    paths = sorted(Path("config").glob("*.yml"))
+    assert paths
+    for path in paths:
+        cfg = load_config_pydantic(str(path))
+        assert cfg.io.raw_path
+
+
+def test_timezone_policy_is_validated() -> None:
+    import pytest
+    from pydantic import ValidationError
+
+    from src.etl.utils.config_model import TimezoneConfig
+
+    assert TimezoneConfig(policy_if_na="require_source").policy_if_na == "require_source"
+    with pytest.raises(ValidationError):
+        TimezoneConfig(policy_if_na="guess")
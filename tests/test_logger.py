@@ -0,0 +1,19 @@
+# tests/test_logger.py
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+
+def test_log_dir_created_on_first_record_not_on_import(tmp_path: Path) -> None:
+    log_dir = tmp_path / "logs"
+    code = (
+        "import os, src.run\n"
+        "from src.etl.utils.logger import LOG_DIR, get_logger\n"
+        "assert not os.path.exists(LOG_DIR)\n"
+        "get_logger('Probe').info('hello')\n"
+        "assert os.path.exists(os.path.join(LOG_DIR, 'etl.log'))\n"
+    )
+    env = {**os.environ, "LOG_DIR": str(log_dir)}
+    subprocess.run([sys.executable, "-c", code], check=True, env=env)
+    assert "Probe: hello" in (log_dir / "etl.log").read_text()
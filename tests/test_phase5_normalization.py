@@ -47,3 +47,48 @@ def test_protected_columns_not_renamed() -> None:
     assert "Missing required column(s)" in msg
     assert "OPEN" in msg
     assert "HIGH" in msg
+
+
+def test_rename_map_exact_prefix_suffix() -> None:
+    """
+    Coincidencia exacta, por prefijo o sufijo separado por "_"; nunca por substring.
+    """
+    cols = ["OPEN", "high_price", "bid_low", "closed", "symbol"]
+    rename_map = _build_rename_map(cols, columns_map)
+
+    assert rename_map == {"OPEN": "OPEN", "high_price": "HIGH", "bid_low": "LOW"}
+
+
+def test_rename_map_multi_token_and_precedence() -> None:
+    """
+    Variantes con "_" también casan como prefijo/sufijo; si varios targets
+    coinciden gana el último de columns_map.
+    """
+    cmap = {**columns_map, "VOLUME": ["volume", "tick_volume"]}
+    cols = ["raw_tick_volume", "open_close"]
+    rename_map = _build_rename_map(cols, cmap)
+
+    assert rename_map == {"raw_tick_volume": "VOLUME", "open_close": "CLOSE"}
+
+
+def test_bad_token_from_csv_reader_is_counted_and_skipped(tmp_path) -> None:
+    from src.etl.extract.csv_reader import CSVReader
+    from src.etl.transform.resample import resample_ohlc
+
+    path = tmp_path / "bad.csv"
+    path.write_text(
+        "timestamp,open,high,low,close\n"
+        "2024-01-01 00:00:00,1.1,1.2,1.0,1.1\n"
+        "2024-01-01 00:01:00,1.1,1.2,1.0,1.12\n"
+        "2024-01-01 00:02:00,1.1,1.2,1.0,1.15\n"
+        "2024-01-01 00:03:00,1.1,1.2,1.0,bad\n"
+    )
+    df = CSVReader().read(path)
+    out = normalize_df(df, columns_map, required_columns, None, "UTC", arrow_backend=True)
+
+    report = out.attrs["normalization_report"]
+    assert report["dtypes"]["numeric_coercions"]["CLOSE"] == 1
+    assert out["CLOSE"].isna().sum() == 1
+
+    res = resample_ohlc(out, "2min", drop_incomplete=True)
+    assert res["CLOSE"].tolist() == [1.12, 1.15]
@@ -2,8 +2,9 @@ import json
 from pathlib import Path
 
 import pandas as pd
+import pyarrow.parquet as pq
 
-from src.etl.load.exporter import append_export_log, write_parquet_with_metadata
+from src.etl.load.exporter import ExportLog, append_export_log, write_parquet_with_metadata
 
 
 def _make_sample_df() -> pd.DataFrame:
@@ -30,14 +31,23 @@ def test_write_parquet_with_metadata(tmp_path: Path) -> None:
         df, out, compression="zstd", engine="pyarrow", partition_cols=["YEAR"]
     )
     assert "rows" in report
-    # sidecar metadata file exists
-    meta_file = out.with_name(out.name + ".meta.json")
-    assert meta_file.exists()
-    with open(meta_file, "r", encoding="utf-8") as fh:
-        meta = json.load(fh)
+    # export report lives in the parquet footer (no sidecar file)
+    assert not out.with_name(out.name + ".meta.json").exists()
+    part_file = next(out.rglob("*.parquet"))
+    kv = pq.read_metadata(part_file).metadata
+    meta = json.loads(kv[b"EXPORT_REPORT"])
     assert meta["rows"] == report["rows"]
 
 
+def test_export_report_in_footer_single_file(tmp_path: Path) -> None:
+    df = _make_sample_df()
+    out = tmp_path / "sample_1m.parquet"
+    report = write_parquet_with_metadata(df, out, compression="zstd", row_group_size=4)
+    meta = json.loads(pq.read_metadata(out).metadata[b"EXPORT_REPORT"])
+    assert meta["rows"] == report["rows"] == 10
+    assert meta["compression"] == "zstd"
+
+
 def test_append_export_log(tmp_path: Path) -> None:
     log_dir = tmp_path / "logs"
     entry = {"a": 1}
@@ -47,3 +57,67 @@ def test_append_export_log(tmp_path: Path) -> None:
     with open(log_file, "r", encoding="utf-8") as fh:
         lines = fh.read().strip().splitlines()
     assert len(lines) == 1
+
+
+def test_export_log_appends_ndjson(tmp_path: Path) -> None:
+    log_dir = tmp_path / "logs"
+    with ExportLog(log_dir) as log:
+        log.append({"timeframe": "1m", "rows": 10})
+        log.append({"timeframe": "5m", "rows": 2})
+    with open(log_dir / "export_log.ndjson", "r", encoding="utf-8") as fh:
+        lines = fh.read().strip().splitlines()
+    assert [json.loads(line)["timeframe"] for line in lines] == ["1m", "5m"]
+
+
+def test_export_log_survives_short_writes(tmp_path: Path, monkeypatch) -> None:
+    import src.etl.load.exporter as exporter
+
+    real_write = exporter.os.write
+    # at most 7 bytes per call, like a pipe / interrupted write
+    monkeypatch.setattr(exporter.os, "write", lambda fd, data: real_write(fd, bytes(data[:7])))
+    log_dir = tmp_path / "logs"
+    append_export_log(log_dir, {"timeframe": "1m", "rows": 10})
+    with ExportLog(log_dir) as log:
+        for i in range(3):
+            log.append({"timeframe": "5m", "rows": i})
+    with open(log_dir / "export_log.ndjson", "r", encoding="utf-8") as fh:
+        lines = fh.read().strip().splitlines()
+    assert [json.loads(line)["rows"] for line in lines] == [10, 0, 1, 2]
+
+
+def test_export_schema_is_canonical(tmp_path: Path) -> None:
+    # narrowed dtypes (as left by shrink_numeric) are written as double / int64
+    df = _make_sample_df().astype({"OPEN": "float32", "HIGH": "float[pyarrow]"})
+    df["VOLUME"] = df["VOLUME"].astype("int8[pyarrow]")
+    df["LOW"] = df["LOW"].astype("int16")
+    out = tmp_path / "narrow.parquet"
+    write_parquet_with_metadata(df, out)
+    schema = pq.read_schema(out)
+    assert schema.field("OPEN").type == "double"
+    assert schema.field("HIGH").type == "double"
+    assert schema.field("LOW").type == "int64"
+    assert schema.field("VOLUME").type == "int64"
+    # caller's frame keeps its dtypes
+    assert str(df["VOLUME"].dtype) == "int8[pyarrow]"
+
+
+def test_all_null_first_row_group(tmp_path: Path) -> None:
+    df = _make_sample_df()
+    df["NOTE"] = [None] * 4 + ["x"] * 6
+    out = tmp_path / "notes.parquet"
+    write_parquet_with_metadata(df, out, row_group_size=4)
+    assert pq.ParquetFile(out).num_row_groups == 3
+    assert pd.read_parquet(out)["NOTE"].tolist() == [None] * 4 + ["x"] * 6
+
+
+def test_unnamed_index_written_as_index_column(tmp_path: Path) -> None:
+    df = _make_sample_df()
+    out = tmp_path / "idx.parquet"
+    write_parquet_with_metadata(df, out)
+    assert "index" in pq.read_schema(out).names
+    assert "__index_level_0__" not in pq.read_schema(out).names
+    back = pd.read_parquet(out)
+    assert isinstance(back.index, pd.DatetimeIndex)
+    assert back.index.equals(df.index.rename("index"))
+    # caller's frame is untouched
+    assert df.index.name is None
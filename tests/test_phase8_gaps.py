@@ -38,3 +38,23 @@ def test_repair_gaps_ffill_and_interpolate(tmp_path: Path) -> None:
     # OPEN/CLOSE interpolation should have eliminated NaNs for price columns if possible
     remaining = report["remaining_nans"]
     assert remaining.get("OPEN", 0) == 0 or remaining.get("CLOSE", 0) == 0
+
+
+def test_detect_gaps_clusters_separate_runs() -> None:
+    idx = pd.date_range("2024-01-01T23:00:00", periods=120, freq="T", tz="UTC")
+    df = pd.DataFrame({"CLOSE": range(120)}, index=idx)
+    # one isolated minute, a 10-minute run and a run crossing midnight
+    drop = [idx[5]] + list(idx[20:30]) + list(idx[57:64])
+    gaps = detect_gaps(df.drop(drop), rule="1T", short_gap_minutes=5)
+
+    assert [g.start for g in gaps] == [idx[5], idx[20], idx[57]]
+    assert [g.end for g in gaps] == [idx[5], idx[29], idx[63]]
+    assert [g.missing_count for g in gaps] == [1, 10, 7]
+    assert [g.length for g in gaps] == [pd.Timedelta(minutes=m) for m in (1, 10, 7)]
+    assert [g.classification for g in gaps] == ["short_gap", "medium_gap", "overnight_gap"]
+
+
+def test_detect_gaps_none_missing() -> None:
+    idx = pd.date_range("2024-01-01T00:00:00", periods=10, freq="T", tz="UTC")
+    df = pd.DataFrame({"CLOSE": range(10)}, index=idx)
+    assert detect_gaps(df, rule="1T") == []
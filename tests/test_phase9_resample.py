@@ -1,7 +1,9 @@
 # tests/test_phase9_resample.py
+import numpy as np
 import pandas as pd
 
-from src.etl.transform.resample import resample_ohlc
+from src.etl.transform import resample as resample_mod
+from src.etl.transform.resample import _ohlc_bins_loop, _resample_fixed, resample_ohlc
 
 
 def _make_1min_sample() -> pd.DataFrame:
@@ -47,3 +49,51 @@ def test_drop_incomplete_behavior() -> None:
     # If CLOSE is missing for that interval, it should be dropped (no NaN CLOSE rows)
     if "CLOSE" in res.columns:
         assert not res["CLOSE"].isna().any()
+
+
+def test_fixed_kernel_matches_pandas_resample() -> None:
+    # gaps (empty bins), NaNs and Arrow/int dtypes; the plain-Python kernel
+    # is the same code numba compiles
+    idx = pd.date_range("2024-01-01T00:03:00", periods=40, freq="T", tz="UTC").delete(range(10, 22))
+    rng = np.random.default_rng(0)
+    close = rng.normal(1.1, 0.01, len(idx))
+    close[[3, 4]] = np.nan
+    df = pd.DataFrame(
+        {
+            "OPEN": close,
+            "HIGH": pd.array(close + 0.01, dtype="double[pyarrow]"),
+            "CLOSE": close,
+            "VOLUME": pd.array(rng.integers(50, 100, len(idx)), dtype="int8[pyarrow]"),
+            "TICKS": rng.integers(0, 5, len(idx)),
+        },
+        index=idx,
+    )
+    agg = {"OPEN": "first", "HIGH": "max", "CLOSE": "last", "VOLUME": "sum", "TICKS": "mean"}
+    for rule in ("5T", "7T", "1H"):
+        fixed = _resample_fixed(df, rule, agg, kernel=_ohlc_bins_loop)
+        assert fixed is not None
+        res, size = fixed
+        pd.testing.assert_frame_equal(res, df.resample(rule).agg(agg))
+        assert (size == df.resample(rule).size().to_numpy()).all()
+
+
+def test_resample_ohlc_same_result_with_kernel(monkeypatch) -> None:
+    df = _make_1min_sample().drop(pd.Timestamp("2024-01-01T00:02:00", tz="UTC"))
+    df["SYMBOL"] = "EURUSD"
+    expected = resample_ohlc(df, "2T", drop_incomplete=False)
+    monkeypatch.setattr(resample_mod, "_ohlc_bins_jit", _ohlc_bins_loop)
+    pd.testing.assert_frame_equal(resample_ohlc(df, "2T", drop_incomplete=False), expected)
+
+
+def test_constant_categorical_symbol_stays_categorical() -> None:
+    df = _make_1min_sample().drop(pd.Timestamp("2024-01-01T00:02:00", tz="UTC"))
+    df["SYMBOL"] = pd.Categorical(["EURUSD"] * len(df))
+    for drop_incomplete in (True, False):
+        res = resample_ohlc(df, "2T", drop_incomplete=drop_incomplete)
+        assert res["SYMBOL"].dtype == df["SYMBOL"].dtype
+        assert res["SYMBOL"].dropna().eq("EURUSD").all()
+    # empty bins keep a missing symbol, as groupby "last" does
+    gappy = df.drop(df.index[1:3])
+    res = resample_ohlc(gappy, "1T", drop_incomplete=False)
+    expected = gappy.resample("1T")["SYMBOL"].last()
+    pd.testing.assert_series_equal(res["SYMBOL"], expected, check_freq=False)
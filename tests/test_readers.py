@@ -0,0 +1,106 @@
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.etl.extract.csv_reader import CSVReader
+from src.etl.extract.extractor import Extractor
+from src.etl.extract.parquet_reader import ParquetReader
+from src.etl.utils.shrink import shrink_numeric
+
+
+def _make_sample_df(n: int = 50) -> pd.DataFrame:
+    idx = pd.date_range("2024-01-01T00:00:00", periods=n, freq="min")
+    close = 1.1 + np.arange(n) * 1e-4
+    return pd.DataFrame(
+        {
+            "datetime": idx,
+            "open": close,
+            "high": close + 1e-4,
+            "low": close - 1e-4,
+            "close": close,
+            "volume": np.arange(1, n + 1),
+            "symbol": "eurusd",
+        }
+    )
+
+
+def test_csv_round_trip(tmp_path: Path) -> None:
+    src = _make_sample_df()
+    path = tmp_path / "eurusd.csv"
+    src.to_csv(path, index=False)
+
+    reader = CSVReader()
+    df = reader.read(path)
+
+    assert reader.metadata()["rows"] == len(src)
+    assert pd.api.types.is_datetime64_any_dtype(df["datetime"])
+    assert (df["datetime"] == src["datetime"]).all()
+    np.testing.assert_allclose(df["close"].astype("float64"), src["close"])
+    assert df["volume"].astype("int64").tolist() == src["volume"].tolist()
+    assert df["symbol"].astype(str).eq("eurusd").all()
+
+
+def test_csv_reads_mt5_dotted_timestamps(tmp_path: Path) -> None:
+    path = tmp_path / "mt5.csv"
+    path.write_text("time,close\n2024.01.02 10:00,1.1\n2024.01.02 10:01,1.2\n")
+    df = CSVReader().read(path)
+    assert df["time"].tolist() == [
+        pd.Timestamp("2024-01-02 10:00"),
+        pd.Timestamp("2024-01-02 10:01"),
+    ]
+
+
+def test_parquet_round_trip_with_projection(tmp_path: Path) -> None:
+    src = _make_sample_df()
+    path = tmp_path / "eurusd.parquet"
+    src.to_parquet(path, index=False, row_group_size=20)
+
+    reader = ParquetReader(columns=["datetime", "close", "not_there"])
+    df = reader.read(path)
+    meta = reader.metadata()
+
+    assert df.columns.tolist() == ["datetime", "close"]
+    assert meta["rows"] == len(src)
+    assert meta["row_groups"] == 3
+    assert pd.api.types.is_datetime64_any_dtype(df["datetime"])
+    np.testing.assert_allclose(df["close"].astype("float64"), src["close"])
+
+
+def test_shrink_numeric_keeps_values_and_identifiers() -> None:
+    df = pd.DataFrame(
+        {
+            "VOLUME": np.array([1, 2, 300], dtype=np.int64),
+            "CLOSE": np.array([1.5, 2.25, 3.0], dtype=np.float64),
+            "OPEN": np.array([1.1, 1.2, 1.3], dtype=np.float64),
+            "symbol": np.array([1, 2, 3], dtype=np.int64),
+        }
+    )
+    shrink_numeric(df)
+    assert df["VOLUME"].dtype.itemsize < 8
+    assert df["VOLUME"].tolist() == [1, 2, 300]
+    assert df["CLOSE"].dtype == np.float32
+    assert df["CLOSE"].tolist() == [1.5, 2.25, 3.0]
+    # float32 would round these prices: kept as float64
+    assert df["OPEN"].dtype == np.float64
+    # identifier columns are never downcast
+    assert df["symbol"].dtype == np.int64
+
+
+def test_extractor_keeps_listing_order_and_skips_unknown(tmp_path: Path) -> None:
+    small = _make_sample_df(5)
+    big = _make_sample_df(500)
+    small.to_csv(tmp_path / "a_small.csv", index=False)
+    big.to_csv(tmp_path / "b_big.csv", index=False)
+    big.to_parquet(tmp_path / "c_big.parquet", index=False)
+    (tmp_path / "junk.txt").write_text("x")
+    (tmp_path / "subdir").mkdir()
+
+    names = [e.name for e in os.scandir(tmp_path) if e.name.endswith(("csv", "parquet"))]
+    items = Extractor(tmp_path).load_all()
+
+    # largest-first submission does not change the returned (directory listing) order
+    assert [it["filename"] for it in items] == names
+    rows = {it["filename"]: len(it["df"]) for it in items}
+    assert rows == {"a_small.csv": 5, "b_big.csv": 500, "c_big.parquet": 500}
@@ -0,0 +1,29 @@
+# tests/test_reporting.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.etl.utils import reporting
+from src.etl.utils.reporting import _move_mean, data_quality_report
+
+
+@pytest.mark.skipif(reporting.bn is not None, reason="bottleneck kernel in use")
+def test_move_mean_matches_rolling_on_long_series() -> None:
+    rng = np.random.default_rng(0)
+    close = 40_000 + rng.normal(0, 5, 200_000).cumsum()
+    close[rng.random(close.size) < 0.01] = np.nan
+    expected = pd.Series(close).rolling(50, min_periods=1).mean().to_numpy()
+    np.testing.assert_array_equal(_move_mean(close, 50), expected)
+
+
+def test_report_sma_summary_matches_rolling() -> None:
+    idx = pd.date_range("2024-01-01", periods=3_000, freq="T", tz="UTC")
+    rng = np.random.default_rng(1)
+    close = 150 + rng.normal(0, 0.05, idx.size).cumsum()
+    df = pd.DataFrame({"CLOSE": close}, index=idx)
+    report = data_quality_report(df, sma_windows=(10,))
+    sma = pd.Series(close).rolling(10, min_periods=1).mean()
+    summary = report["indicators"]["SMA_10"]
+    assert summary["last"] == pytest.approx(sma.iloc[-1], rel=1e-12)
+    assert summary["min"] == pytest.approx(sma.min(), rel=1e-12)
+    assert summary["max"] == pytest.approx(sma.max(), rel=1e-12)
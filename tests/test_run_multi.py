@@ -0,0 +1,84 @@
+# tests/test_run_multi.py
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+def _write_inputs(raw: Path) -> None:
+    n = 300
+    idx = pd.date_range("2024-01-01", periods=n, freq="min")
+    c = 1.1 + np.random.default_rng(0).normal(0, 1e-4, n).cumsum()
+    df = pd.DataFrame(
+        {
+            "datetime": idx.strftime("%Y-%m-%d %H:%M:%S"),
+            "open": c,
+            "high": c + 1e-4,
+            "low": c - 1e-4,
+            "close": c,
+            "volume": np.arange(1, n + 1),
+            "symbol": "eurusd",
+        }
+    )
+    # same symbol and date range -> same basename for both inputs
+    df.to_csv(raw / "eurusd.csv", index=False)
+    df.to_csv(raw / "eurusd_copy.csv", index=False)
+
+
+def test_main_multiple_inputs(tmp_path: Path) -> None:
+    raw = tmp_path / "raw"
+    raw.mkdir()
+    _write_inputs(raw)
+    cfg = tmp_path / "cfg.yml"
+    cfg.write_text(
+        f"""
+io:
+  raw_path: "{raw}"
+  processed_path: "{tmp_path}/processed"
+  reports_path: "{tmp_path}/reports"
+  quarantine_path: "{tmp_path}/quarantine"
+parquet:
+  compression: "zstd"
+  engine: "pyarrow"
+  partition_cols: null
+schema:
+  columns_map:
+    TIMESTAMP: ["datetime"]
+    OPEN: ["open"]
+    HIGH: ["high"]
+    LOW: ["low"]
+    CLOSE: ["close"]
+    VOLUME: ["volume"]
+  required_columns: ["TIMESTAMP", "OPEN", "HIGH", "LOW", "CLOSE"]
+timezone:
+  target: "UTC"
+  source_default: null
+resample:
+  timeframes: ["1min", "5min"]
+"""
+    )
+    log_dir = tmp_path / "logs"
+    env = {**os.environ, "LOG_DIR": str(log_dir)}
+    # force the process-pool path even on a single-CPU runner
+    code = (
+        "import os; os.cpu_count = lambda: 2\n"
+        f"from src.run import main; main({str(cfg)!r}, dry_run=False)\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True, env=env)
+
+    # one output dir per input, none overwritten
+    out_dirs = sorted(p.name for p in (tmp_path / "processed").iterdir())
+    assert out_dirs == ["eurusd_20240101_20240101", "eurusd_20240101_20240101_1"]
+    for d in out_dirs:
+        assert len(list((tmp_path / "processed" / d).glob("*.parquet"))) == 2
+
+    export_log = tmp_path / "reports" / "exports" / "export_log.ndjson"
+    assert len(export_log.read_text().splitlines()) == 4
+
+    # records from the worker processes end up in the parent's etl.log
+    text = (log_dir / "etl.log").read_text()
+    assert text.count("Processing input:") == 2
+    assert "ETL run finished." in text
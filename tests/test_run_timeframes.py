@@ -0,0 +1,82 @@
+# tests/test_run_timeframes.py
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src import run
+from src.run import process_dataframe
+
+
+def _make_input(n: int = 240) -> pd.DataFrame:
+    idx = pd.date_range("2024-01-01", periods=n, freq="min")
+    close = 1.1 + np.arange(n) * 1e-4
+    df = pd.DataFrame(
+        {
+            "datetime": idx,
+            "open": close,
+            "high": close + 1e-4,
+            "low": close - 1e-4,
+            "close": close,
+            "volume": np.arange(1, n + 1),
+        }
+    ).drop(index=range(30, 33))
+    df["SYMBOL"] = pd.Categorical(["EURUSD"] * len(df))
+    return df.reset_index(drop=True)
+
+
+def _run(tmp_path: Path, name: str, max_workers: int) -> Path:
+    cfg = {
+        "io": {"reports_path": str(tmp_path / name / "reports")},
+        "parquet": {"compression": "zstd", "engine": "pyarrow", "partition_cols": None},
+        "schema": {
+            "columns_map": {
+                "TIMESTAMP": ["datetime"],
+                "OPEN": ["open"],
+                "HIGH": ["high"],
+                "LOW": ["low"],
+                "CLOSE": ["close"],
+                "VOLUME": ["volume"],
+            },
+            "required_columns": ["TIMESTAMP", "OPEN", "HIGH", "LOW", "CLOSE"],
+        },
+        "timezone": {"target": "UTC", "source_default": None},
+        "resample": {"timeframes": ["1min", "5min", "15min"]},
+    }
+    out_dir = tmp_path / name / "out"
+    process_dataframe(_make_input(), cfg, None, "EURUSD", out_dir, max_workers=max_workers)
+    return tmp_path / name
+
+
+def test_timeframe_pool_matches_inline(tmp_path: Path) -> None:
+    inline = _run(tmp_path, "inline", max_workers=1)
+    pooled = _run(tmp_path, "pooled", max_workers=3)
+
+    files = sorted(p.name for p in (inline / "out").glob("*.parquet"))
+    assert len(files) == 3
+    assert sorted(p.name for p in (pooled / "out").glob("*.parquet")) == files
+    for name in files:
+        pd.testing.assert_frame_equal(
+            pd.read_parquet(inline / "out" / name), pd.read_parquet(pooled / "out" / name)
+        )
+
+    # export-log entries are written by the parent, in timeframe order
+    def timeframes(root: Path) -> list:
+        lines = (root / "reports" / "exports" / "export_log.ndjson").read_text().splitlines()
+        return [json.loads(line)["timeframe"] for line in lines]
+
+    assert timeframes(pooled) == timeframes(inline) == ["1min", "5min", "15min"]
+
+
+def test_timeframe_pool_does_not_pickle_the_frame(tmp_path: Path, monkeypatch) -> None:
+    if run._FORK_CONTEXT is None:
+        pytest.skip("fork start method not available")
+
+    def _no_pickle(self, *args):  # type: ignore[no-untyped-def]
+        raise AssertionError("DataFrame pickled for a worker")
+
+    monkeypatch.setattr(pd.DataFrame, "__reduce_ex__", _no_pickle)
+    pooled = _run(tmp_path, "pooled", max_workers=3)
+    assert len(list((pooled / "out").glob("*.parquet"))) == 3
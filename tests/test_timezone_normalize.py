@@ -47,3 +47,15 @@ def test_ambiguous_dst_marked() -> None:
         assert report["needs_review"] is True
     # final tz must be UTC
     assert report["final_tz"] == "UTC"
+
+
+def test_index_already_in_target_tz_is_returned_as_is() -> None:
+    idx = pd.date_range("2024-01-02 12:00:00", periods=2, freq="min", tz="UTC", name="datetime")
+    df = pd.DataFrame({"value": [1, 2]}, index=idx)
+
+    result_df, report = normalize_datetime(df, source_tz=None, target_tz="UTC")
+
+    assert result_df is df
+    assert report["tz_action"] == "already_target"
+    assert report["final_tz"] == "UTC"
+    assert report["needs_review"] is False